@@ -0,0 +1,334 @@
+"""
+maximum likelihood estimation of the entanglement fidelity from the
+measured ZZ, XX and X-X correlations (promoted from
+scripts/lde/entanglementfidelity_v2/MLE.py).
+
+the multinomial likelihoods are evaluated in log space (gammaln), such
+that they do not overflow for realistic numbers of events, and at once for
+all points of the population grid. the readout error is included with the
+forward model from sscorr (readout_error_matrix).
+
+counts and populations are in the order [00, 01, 10, 11], as in MLE.Emily;
+a = LT1, b = LT2.
+"""
+
+import numpy as np
+from scipy.special import gammaln, xlogy
+from matplotlib import pyplot as plt
+
+from analysis.lib.fitting import fit
+from analysis.lib.lde import sscorr
+
+SIMPLEX_LIMITS = [(0., 1.)] * 3
+AB_LIMITS = [(-.25, .25)] * 2
+
+def log_multinomial(N, p):
+    """
+    log of the multinomial probability of the counts N (length 4) for the
+    probabilities p (shape (4, ...)).
+    """
+    N = np.asarray(N, dtype=float)
+    p = np.asarray(p, dtype=float)
+    idx = (slice(None),) + (np.newaxis,)*(p.ndim-1)
+    return gammaln(N.sum()+1) - gammaln(N+1).sum() + \
+            xlogy(N[idx], p).sum(0)
+
+def diag_log_likelihood(N, p00, p01, p10, E=None):
+    """
+    log likelihood of the counts N for the populations p00, p01, p10
+    (p11 = 1 - p00 - p01 - p10); with the readout error matrix E the
+    measured probabilities are E . p.
+    """
+    p = np.array([p00, p01, p10, np.clip(1.-p00-p01-p10, 0., 1.)])
+    if E is not None:
+        p = np.tensordot(E, p, 1)
+    return log_multinomial(N, p)
+
+def offdiag_log_likelihood(N, a, b, E=None):
+    """
+    as diag_log_likelihood, for the XX populations parametrized by a and b
+    (see lab book): [1/4+a-b, 1/4-a-b, 1/4-a+b, 1/4+a+b].
+    """
+    p = np.array([.25+a-b, .25-a-b, .25-a+b, .25+a+b])
+    if E is not None:
+        p = np.tensordot(E, p, 1)
+    return log_multinomial(N, p)
+
+def _grid(limits, pts, box=None):
+    """
+    the points of a regular grid over the axes limits [(lo, hi), ...];
+    without box, pts points lo + (hi-lo)*i/pts (as in MLE.Emily), otherwise
+    pts points from lo to hi for each (lo, hi) in box.
+    """
+    if box is None:
+        axes = [ lo + (hi-lo)*np.arange(pts)/float(pts) for lo,hi in limits ]
+    else:
+        axes = [ np.linspace(lo, hi, pts) for lo,hi in box ]
+    return [ g.ravel() for g in np.meshgrid(*axes, indexing='ij') ]
+
+def simplex_grid(pts, box=None):
+    """
+    the grid points (p00, p01, p10) that are physical, p00+p01+p10 <= 1.
+    """
+    p00, p01, p10 = _grid(SIMPLEX_LIMITS, pts, box)
+    ok = p00+p01+p10 <= 1.
+    return p00[ok], p01[ok], p10[ok]
+
+def ab_grid(pts, box=None):
+    """
+    the grid points (a, b) that are physical, abs(b) <= 1/4 - abs(a).
+    """
+    a, b = _grid(AB_LIMITS, pts, box)
+    ok = abs(b) <= .25-abs(a)
+    return a[ok], b[ok]
+
+def likelihood_grid(loglk, grid, limits, pts, adaptive=False,
+        coarse_pts=21, cutoff=20.):
+    """
+    evaluates the log likelihood function loglk on the grid given by the
+    function grid (simplex_grid or ab_grid) and returns the grid points and
+    the likelihood, normalized to a maximum of 1.
+
+    adaptive: first evaluate on a coarse grid (coarse_pts per axis), and
+    then put the pts points per axis only into the box around the points
+    within cutoff of the maximum log likelihood (plus one coarse step).
+    """
+    box = None
+    if adaptive:
+        pp = grid(coarse_pts)
+        l = loglk(*pp)
+        sel = l >= l.max() - cutoff
+        box = []
+        for x, (lo, hi) in zip(pp, limits):
+            step = (hi-lo)/float(coarse_pts)
+            box.append((max(lo, x[sel].min()-step), min(hi, x[sel].max()+step)))
+
+    pp = grid(pts, box)
+    l = loglk(*pp)
+    return pp, np.exp(l - l.max())
+
+def _normalize(h, dx):
+    return h / np.trapz(h, dx=dx)
+
+def _moments(x, lk):
+    """
+    mean and variance of x over the grid points, weighted by the likelihood.
+    """
+    mean = np.sum(x*lk)/np.sum(lk)
+    return mean, np.sum((x-mean)**2*lk)/np.sum(lk)
+
+def _fit_gauss(x, y, do_print=False):
+    """
+    center and width of a (normalized) gaussian fitted to the distribution
+    y(x), as in MLE.Emily; mean and standard deviation if the fit fails.
+    """
+    sigma = fit.Parameter(0.05)
+    x0 = fit.Parameter(0.75)
+    def ff(x):
+        return 1./(sigma()*np.sqrt(2*np.pi)) * np.exp(-0.5*(x-x0())**2/sigma()**2)
+
+    res = fit.fit1d(x, y, None, fitfunc=ff, p0=[sigma,x0],
+            do_print=do_print, ret=True)
+    if res:
+        return x0(), abs(sigma())
+
+    mean = np.sum(x*y)/np.sum(y)
+    return mean, np.sqrt(np.sum((x-mean)**2*y)/np.sum(y))
+
+
+class FidelityMLE:
+    """
+    likelihoods of the ZZ parity, the XX term and the fidelity for one set
+    of correlations; usage: set the counts (and settings), then
+    likelihood() and analysis().
+    """
+
+    def __init__(self, N_ZZ, N_XX, N_XmX, state='psi2', **kw):
+        self.N_ZZ = np.asarray(N_ZZ)
+        self.N_XX = np.asarray(N_XX)
+        self.N_XmX = np.asarray(N_XmX)
+        self.state = state
+
+        # readout fidelities
+        self.F0a = kw.pop('F0a', 0.921)
+        self.F1a = kw.pop('F1a', 0.997)
+        self.F0b = kw.pop('F0b', 0.822)
+        self.F1b = kw.pop('F1b', 0.989)
+
+        self.prob_pts = kw.pop('prob_pts', 101)
+        self.ab_pts = kw.pop('ab_pts', 101)
+        self.result_bins = kw.pop('result_bins', 50)
+        self.F_bins = kw.pop('F_bins', 50)
+        self.XX_independent = kw.pop('XX_independent', True)
+
+        self.adaptive = kw.pop('adaptive', False)
+        self.coarse_pts = kw.pop('coarse_pts', 21)
+        self.cutoff = kw.pop('cutoff', 20.)
+
+        if len(kw) > 0:
+            raise ValueError('unknown settings: %s' % ', '.join(kw.keys()))
+
+    def _grid_kw(self):
+        return dict(adaptive=self.adaptive, coarse_pts=self.coarse_pts,
+                cutoff=self.cutoff)
+
+    def _diag(self, N):
+        """
+        likelihood on the population grid, and the histograms of the
+        likelihood for each population.
+        """
+        pp, lk = likelihood_grid(
+                lambda *p: diag_log_likelihood(N, *p, E=self.E),
+                simplex_grid, SIMPLEX_LIMITS, self.prob_pts, **self._grid_kw())
+        pp = list(pp) + [np.clip(1.-pp[0]-pp[1]-pp[2], 0., 1.)]
+        phist = [ _normalize(np.histogram(p, bins=self.prob_pts, range=(0,1),
+            weights=lk)[0], 1./self.prob_pts) for p in pp ]
+        return pp, lk, phist
+
+    def _ZZlk(self):
+        (p00, p01, p10, p11), lk, self.ZZ_phist = self._diag(self.N_ZZ)
+
+        ZZ = p01+p10
+        ZZLB = p01+p10-2*np.sqrt(p00*p11)
+        self.ZZparity_moments = _moments(ZZ, lk)
+        self.ZZparityLB_moments = _moments(ZZLB, lk)
+
+        hist = np.histogram(ZZ, bins=self.result_bins, range=(0,1),
+                weights=lk)[0]
+        histLB = np.histogram(ZZLB, bins=self.result_bins, range=(0,1),
+                weights=lk)[0]
+        return _normalize(hist, self.ZZ_dx), _normalize(histLB, self.ZZ_dx)
+
+    def _XXlk(self, N, sign=1):
+        """
+        likelihood of the XX term (sign=-1 for X-X), the histograms of the
+        populations, and the mean and variance of the XX term.
+        """
+        if self.XX_independent:
+            (p00, p01, p10, p11), lk, phist = self._diag(N)
+            XX = p00+p11-p01-p10
+        else:
+            (a, b), lk = likelihood_grid(
+                    lambda a, b: offdiag_log_likelihood(N, a, b, E=self.E),
+                    ab_grid, AB_LIMITS, self.ab_pts, **self._grid_kw())
+            phist = None
+            XX = 4*a
+
+        hist = np.histogram(sign*XX, bins=self.result_bins, range=(-1,1),
+                weights=lk)[0]
+        return _normalize(hist, self.XX_dx), phist, _moments(sign*XX, lk)
+
+    def likelihood(self):
+        self.E = sscorr.readout_error_matrix(self.F0a, self.F0b,
+                self.F1a, self.F1b)
+
+        self.ZZ_bin_edges = np.linspace(0,1,self.result_bins+1)
+        self.ZZ_dx = self.ZZ_bin_edges[1] - self.ZZ_bin_edges[0]
+        self.ZZ_x = self.ZZ_bin_edges[:-1] + self.ZZ_dx/2.
+        self.XX_bin_edges = np.linspace(-1,1,self.result_bins+1)
+        self.XX_dx = self.XX_bin_edges[1] - self.XX_bin_edges[0]
+        self.XX_x = self.XX_bin_edges[:-1] + self.XX_dx/2.
+        self.F_bin_edges = np.linspace(0, 1, self.F_bins+1)
+        self.F_dx = self.F_bin_edges[1] - self.F_bin_edges[0]
+        self.F_x = self.F_bin_edges[:-1]+self.F_dx/2.
+        sign = -1 if self.state == 'psi2' else 1
+
+        self.ZZparity_lk, self.ZZparityLB_lk = self._ZZlk()
+
+        # we need the average of XX and XmX
+        hist_XX, self.XX_phist, XX_m = self._XXlk(self.N_XX)
+        hist_XmX, self.XmX_phist, XmX_m = self._XXlk(self.N_XmX, sign=-1)
+        self.XXterm_moments = (0.5*(XX_m[0]+XmX_m[0]),
+                0.25*(XX_m[1]+XmX_m[1]))
+        XXvals, XmXvals = np.meshgrid(self.XX_x, self.XX_x)
+        hhXX, hhXmX = np.meshgrid(hist_XX, hist_XmX)
+        self.XXterm_lk = np.histogram(0.5*(XXvals+XmXvals),
+                bins=self.result_bins, range=(-1,1), density=True,
+                weights=hhXmX*hhXX)[0]
+
+        # the fidelity likelihoods
+        ZZvals, XXvals = np.meshgrid(self.ZZ_x, self.XX_x)
+        ZZlks, XXlks = np.meshgrid(self.ZZparity_lk, self.XXterm_lk)
+        self.F_lk = np.histogram(0.5*(ZZvals+XXvals*sign), bins=self.F_bins,
+                range=(0,1), density=True, weights=ZZlks*XXlks)[0]
+
+        ZZLBlks, XXlks = np.meshgrid(self.ZZparityLB_lk, self.XXterm_lk)
+        self.FLB_lk = np.histogram(0.5*(ZZvals+XXvals*sign),
+                bins=self.F_bins, range=(0,1), density=True,
+                weights=ZZLBlks*XXlks)[0]
+
+        # mean and variance of the fidelity, straight from those of the
+        # independent ZZ and XX terms on the grid (no binning)
+        XXm, XXv = self.XXterm_moments
+        self.F_moments, self.FLB_moments = [ (0.5*(m+sign*XXm), 0.25*(v+XXv))
+                for m,v in (self.ZZparity_moments, self.ZZparityLB_moments) ]
+
+    def analysis(self, do_print=False, method='moments'):
+        """
+        fidelity and lower bound (incl. the sqrt term) with uncertainties.
+        method 'moments': mean and standard deviation of the likelihoods,
+        computed on the grid points, so not limited by the binning of F;
+        'fit': gaussian fits to the binned likelihoods F_lk, FLB_lk (as
+        MLE.Emily; only good if the likelihoods span many F_bins).
+        """
+        if method == 'fit':
+            self.F, self.u_F = _fit_gauss(self.F_x, self.F_lk, do_print)
+            self.FLB, self.u_FLB = _fit_gauss(self.F_x, self.FLB_lk, do_print)
+        elif method == 'moments':
+            (self.F, var), (self.FLB, varLB) = self.F_moments, self.FLB_moments
+            self.u_F, self.u_FLB = np.sqrt(var), np.sqrt(varLB)
+        else:
+            raise ValueError('unknown method: %s' % method)
+        return self.F, self.u_F, self.FLB, self.u_FLB
+
+    def plot(self):
+        fig = plt.figure(figsize=(6,6))
+        ax = fig.add_subplot(311)
+        ax.plot(self.ZZ_x+self.ZZ_dx/2., self.ZZparity_lk, 'k',
+                drawstyle='steps', label='excl sqrt')
+        ax.plot(self.ZZ_x+self.ZZ_dx/2., self.ZZparityLB_lk, 'r',
+                drawstyle='steps', label='incl sqrt')
+        ax.set_xlabel('ZZ term')
+        ax.set_ylabel('Likelihood')
+        ax.legend(loc=2)
+
+        bx = fig.add_subplot(312)
+        bx.plot(self.XX_x+self.XX_dx/2., self.XXterm_lk, 'k',
+                drawstyle='steps')
+        bx.set_xlabel('XX term')
+        bx.set_ylabel('Likelihood')
+
+        cx = fig.add_subplot(313)
+        cx.plot(self.F_x+self.F_dx/2., self.F_lk, 'k', drawstyle='steps',
+                label='excl sqrt')
+        cx.plot(self.F_x+self.F_dx/2., self.FLB_lk, 'r', drawstyle='steps',
+                label='incl sqrt')
+        cx.set_xlabel('Fidelity')
+        cx.set_ylabel('Likelihood')
+        cx.legend(loc=2)
+
+        plt.tight_layout()
+        return fig
+
+
+def fidelity_sweep(N_ZZ, N_XX, N_XmX, state='psi2', **kw):
+    """
+    F, u_F, FLB, u_FLB for each set of correlations, e.g., for all window
+    settings; the counts have the 4 correlations on the last axis and the
+    same leading shape. kw are the settings of FidelityMLE (use
+    adaptive=True for fast and sufficiently resolved grids), and method
+    (see FidelityMLE.analysis).
+    """
+    method = kw.pop('method', 'moments')
+    N_ZZ, N_XX, N_XmX = np.asarray(N_ZZ), np.asarray(N_XX), np.asarray(N_XmX)
+    shape = N_ZZ.shape[:-1]
+    res = dict([ (k, np.zeros(shape)) for k in ('F', 'u_F', 'FLB', 'u_FLB') ])
+
+    for idx in np.ndindex(*shape):
+        mle = FidelityMLE(N_ZZ[idx], N_XX[idx], N_XmX[idx], state=state,
+                **kw)
+        mle.likelihood()
+        res['F'][idx], res['u_F'][idx], res['FLB'][idx], res['u_FLB'][idx] = \
+                mle.analysis(method=method)
+
+    return res
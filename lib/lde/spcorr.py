@@ -1,5 +1,6 @@
 import os
 import numpy as np
+import h5py
 import matplotlib.pyplot as plt
 
 from analysis.lib.pq import hht3
@@ -167,9 +168,8 @@ def prepare_correlations(datfolder, datfile='hh_prefiltered_events.npz'):
     d = np.load(os.path.join(datfolder, datfile))
     hhdata = d['data']
     d.close()
-    hhpludat = hht3.filter_counts_on_marker(hhdata, 2, [-1,0])
-    hhpludat1 = hht3.filter_counts_on_marker(hhdata, 2, [-1])
-    hhpludat2 = hht3.filter_counts_on_marker(hhdata, 2, [0])
+    hhpludat, hhpludat1, hhpludat2 = [ hhdata[m] for m in 
+            hht3.counts_on_marker_masks(hhdata, 2, [[-1,0], [-1], [0]]) ]
 
     ### some sanity checks
     print ''
@@ -371,6 +371,35 @@ def filter_PLU(data, mchan=2):
     
     return filtered
 
+def _split_file(fp, windows, sync_of, ch0maxtime, ch1maxtime, *arg, **kw):
+    """
+    load and prefilter a single raw file for split. returns the data 
+    (markers 1 deleted), the list of window data and the new sync offset;
+    data is None if nothing is left after filtering.
+    """
+    data = hht3.data_from_file(fp, ch0_lastbin=ch0maxtime, 
+            ch1_lastbin=ch1maxtime, *arg, **kw)
+    
+    if len(data) == 0:
+        return None, None, sync_of
+
+    data[:,0] += sync_of + 100
+    sync_of = int(data[-1,0]) + 1
+
+    masks = hht3.counts_on_marker_masks(data, 1, 
+            [windows] + [ [w] for w in windows ])
+    if not masks[0].any():
+        return None, None, sync_of
+    
+    windowdata = [ hht3.delete_markers(data[m], 1) for m in masks[1:] ]
+    data = hht3.delete_markers(data[masks[0]], 1)
+
+    return data, windowdata, sync_of
+
+def _rawfiles(rawfolder, file_contains='LDE'):
+    return [ f for f in os.listdir(rawfolder) if file_contains in f and \
+            f[:1] != '.' and f[-4:] == '.npz' ]
+
 # in case of large data sets, we need to treat data in chunks;
 # can combine back after reducing to some reasonable size
 def split(rawfolder, file_contains='LDE', print_status=False, *arg, **kw):
@@ -379,49 +408,80 @@ def split(rawfolder, file_contains='LDE', print_status=False, *arg, **kw):
     ch0maxtime = kw.pop('ch0maxtime', 700)
     ch1maxtime = kw.pop('ch1maxtime', 700)
 
-    allfiles = [ f for f in os.listdir(rawfolder) if file_contains in f and \
-            f[:1] != '.' and f[-4:] == '.npz' ]
-    lastidx = len(allfiles)
+    allfiles = _rawfiles(rawfolder, file_contains)
 
-    # we don't have too much data left over, so can use this approach
-    finaldata = np.zeros((0,4), dtype=np.uint)
-    windowdata = [ np.zeros((0,4), dtype=np.uint) for w in windows ]
+    # collect the per-file results and combine only once at the end
+    finaldata = [ np.zeros((0,4), dtype=np.uint) ]
+    windowdata = [ [ np.zeros((0,4), dtype=np.uint) ] for w in windows ]
         
     sync_of = 0
     for i,f in enumerate(allfiles):
         if print_status:
             print 'file %d (%d) ...' % (i+1, len(allfiles))
         
-        fp = os.path.join(rawfolder, f)
-        data = hht3.data_from_file(fp, ch0_lastbin=ch0maxtime, 
-                ch1_lastbin=ch1maxtime, *arg, **kw)
-        
-        if len(data) == 0:
+        data, _windowdata, sync_of = _split_file(os.path.join(rawfolder, f),
+                windows, sync_of, ch0maxtime, ch1maxtime, *arg, **kw)
+        if data is None:
             continue
 
-        data[:,0] += sync_of + 100
-        sync_of = data[-1,0] + 1
+        finaldata.append(data)
+        for j,wd in enumerate(_windowdata):
+            windowdata[j].append(wd)
 
-        data = hht3.filter_counts_on_marker(data, 1, windows)
-        if len(data) == 0:
-            continue
-        
-        _windowdata = []
-        for w in windows:
-            _wd = hht3.filter_counts_on_marker(data, 1, [w])
-            _wd = hht3.delete_markers(_wd,1)
-            _windowdata.append(_wd)
-            
-        data = hht3.delete_markers(data, 1)
-
-        finaldata = np.vstack((finaldata, data))
-        for i,w in enumerate(windows):
-            windowdata[i] = np.vstack((windowdata[i], _windowdata[i]))
-
-        ret = [finaldata]
-        ret.extend(windowdata)
+    ret = [np.vstack(finaldata)]
+    ret.extend([ np.vstack(wd) for wd in windowdata ])
         
     return tuple(ret)
+
+def split_to_hdf5(rawfolder, filepath, file_contains='LDE', 
+        print_status=False, *arg, **kw):
+    """
+    out-of-core version of split: the raw files are processed one at a time
+    and the results are appended to resizable datasets 'hhdata' and 
+    'window<w>' in the HDF5 file filepath (overwritten if it exists).
+    
+    returns the datasets in the same order as split does; these are 
+    loaded only when sliced (e.g., ds[:] or ds[i:j]). the file is opened
+    read-only; close it with ds.file.close().
+    """
+    windows = kw.pop('windows', [1,2])
+    ch0maxtime = kw.pop('ch0maxtime', 700)
+    ch1maxtime = kw.pop('ch1maxtime', 700)
+    names = ['hhdata'] + [ 'window%d' % w for w in windows ]
+    
+    allfiles = _rawfiles(rawfolder, file_contains)
+
+    f = h5py.File(filepath, 'w')
+    try:
+        dsets = [ f.create_dataset(n, (0,4), dtype=np.uint, maxshape=(None,4),
+            chunks=True) for n in names ]
+        
+        sync_of = 0
+        for i,fn in enumerate(allfiles):
+            if print_status:
+                print 'file %d (%d) ...' % (i+1, len(allfiles))
+        
+            data, windowdata, sync_of = _split_file(
+                    os.path.join(rawfolder, fn), windows, sync_of, 
+                    ch0maxtime, ch1maxtime, *arg, **kw)
+            if data is None:
+                continue
+
+            for ds, d in zip(dsets, [data] + windowdata):
+                n = ds.shape[0]
+                ds.resize((n+len(d), 4))
+                ds[n:] = d
+
+        f.attrs['sync_of'] = sync_of
+        f.attrs['windows'] = windows
+        f.close()
+    except:
+        f.close()
+        raise
+
+    f = h5py.File(filepath, 'r')
+    return tuple([ f[n] for n in names ])
+
 load_hhdata = split
 
 def barplot_correlations(datfolder, correlations, F0, F1, F0err, F1err):
@@ -24,9 +24,8 @@ def load_hhdata(rawfolder, file_contains='LDE', *arg, **kw):
 # - already filtered on time and markers, markers 1 deleted
 def get_hhpludata(hhdata):
 
-    hhpludata = hht3.filter_counts_on_marker(hhdata, 2, [-1,0])
-    hhpludata1 = hht3.filter_counts_on_marker(hhdata, 2, [-1])
-    hhpludata2 = hht3.filter_counts_on_marker(hhdata, 2, [0])
+    hhpludata, hhpludata1, hhpludata2 = [ hhdata[m] for m in 
+            hht3.counts_on_marker_masks(hhdata, 2, [[-1,0], [-1], [0]]) ]
 
     # some sanity checks
     if (len(hhpludata)==0):
@@ -49,18 +48,19 @@ def get_double_clicks(data,ch0_start=0, ch0_stop=700,
     clicks=hht3.get_allclicks(data)   
     clicks=hht3.filter_timewindow(clicks,0,ch0_start,ch0_stop)
     clicks=hht3.filter_timewindow(clicks,1,ch1_start,ch1_stop)
-    clicks=np.vstack((clicks,np.zeros(4,dtype=np.uint32)))
-    clicks=np.vstack((np.zeros(4,dtype=np.uint32),clicks))
-    delta_marker=clicks[1:,0]-clicks[:-1,0]
-    double_click_idx=np.ravel(np.where(delta_marker==1))
-    triple_click_idx=np.ravel(np.where(delta_marker==0))
-
-    bad_idx=np.append(triple_click_idx,\
-            [triple_click_idx-np.ones(len(triple_click_idx),dtype=np.uint),\
-            triple_click_idx+np.ones(len(triple_click_idx),dtype=np.uint)])
-
-    valid_double_click_idx=np.setdiff1d(double_click_idx,bad_idx)
-    valid_double_click_idx=np.sort(np.append(valid_double_click_idx,valid_double_click_idx+np.ones(len(valid_double_click_idx),dtype=np.uint)))
+    if len(clicks) < 2:
+        return clicks[:0]
+    
+    # double clicks: clicks in consecutive syncs, each alone in its sync
+    syncs=clicks[:,0].astype(np.int64)
+    same_sync=syncs[1:]==syncs[:-1]
+    alone=np.ones(len(syncs),dtype=bool)
+    alone[1:]&=np.logical_not(same_sync)
+    alone[:-1]&=np.logical_not(same_sync)
+    valid_double_click_idx=np.flatnonzero(np.logical_and(
+            syncs[1:]-syncs[:-1]==1, np.logical_and(alone[:-1], alone[1:])))
+    valid_double_click_idx=np.sort(np.append(valid_double_click_idx,
+            valid_double_click_idx+1))
     return clicks[valid_double_click_idx]
 
 def get_double_clicks_slow(hhdata, ch0_start=0, ch0_stop=700,
@@ -146,6 +146,102 @@ def load_adwin_data(datfolder, DATIDX=0, *arg, **kw):
     return SSROs_adwin_LT1, SSROs_adwin_LT2, CRs_adwin_LT1, CRs_adwin_LT2, gate_phase
 
 
+def _photon_groups(hhpludat):
+    """
+    returns the photons of hhpludat sorted by sync number (stable, i.e., 
+    photons within a sync keep their order), the unique sync numbers,
+    and for each photon the index of its sync in the unique syncs.
+    """
+    photons = hhpludat[hhpludat[:,3]==0]
+    photons = photons[np.argsort(photons[:,0], kind='mergesort')]
+    syncs, group = np.unique(photons[:,0].astype(np.int64), 
+            return_inverse=True)
+    return photons, syncs, group
+
+def _group_index(syncs, s):
+    """
+    index of each element of s in the sorted unique syncs, -1 if not found.
+    """
+    if len(syncs) == 0:
+        return np.zeros(len(s), dtype=int) - 1
+    idx = np.searchsorted(syncs, s)
+    idx[idx == len(syncs)] = 0
+    return np.where(syncs[idx] == s, idx, -1)
+
+def _window_counts(photons, group, noof_groups, ch, start, stop):
+    """
+    per sync group: the number of photons on channel ch with 
+    start < time < stop, and the time of the first of them (-1 if none).
+    both arrays have an extra last element (0, -1) such that a group index
+    of -1 (no photons in that sync) can be used directly.
+    """
+    t = photons[:,1].astype(np.int64)
+    inwin = np.logical_and(photons[:,2] == ch, 
+            np.logical_and(t > start, t < stop))
+    counts = np.bincount(group[inwin], minlength=noof_groups+1)
+    counts[-1] = 0
+
+    first = np.zeros(noof_groups+1, dtype=np.int64) - 1
+    idx = np.flatnonzero(inwin)
+    g = group[idx]
+    isfirst = np.ones(len(idx), dtype=bool)
+    isfirst[1:] = g[1:] != g[:-1]
+    first[g[isfirst]] = t[idx[isfirst]]
+    
+    return counts, first
+
+def _wrap_bits(hhpludat):
+    """
+    two ch0 times are subtracted as unsigned numbers in windowdata_slow 
+    (if the data is unsigned), and wrap around: the number of bits, 
+    0 for signed data.
+    """
+    if np.issubdtype(hhpludat.dtype, np.unsignedinteger):
+        return 8*hhpludat.dtype.itemsize
+    return 0
+
+def _window_codes(lens, splens, t1, t2, wrap_bits, dt_max, dt_min):
+    """
+    window code (0 invalid, 1 ch0-ch0, 2 ch0-ch1, 3 ch1-ch0, 4 ch1-ch1)
+    per marker from the photon numbers in the windows
+    lens = (w1ch0, w1ch1, w2ch0, w2ch1), the photon numbers in the
+    single photon range splens (same order), and the times t1, t2 of the 
+    window photons. dt_max is a list of dt cuts (-1: no cut); the result
+    has shape (len(dt_max), markers).
+    """
+    both_ch0 = np.logical_and(lens[1] == 0, lens[3] == 0)
+    valid = np.logical_and(lens[0] + lens[1] == 1, lens[2] + lens[3] == 1)
+
+    # apply the single-photon filter
+    w1ch0len, w1ch1len, w2ch0len, w2ch1len = [ np.where(sp > l, 0, l) 
+            for l, sp in zip(lens, splens) ]
+
+    # filter on relative timing
+    dt_max = np.asarray(dt_max, dtype=float)
+    valid = np.repeat(valid[np.newaxis,:], len(dt_max), axis=0)
+    if np.any(dt_max != -1):
+        dt = (t2 - t1).astype(float)
+        absdt = np.abs(dt)
+        if wrap_bits > 0:
+            wrapped = np.logical_and(both_ch0, dt < 0)
+            absdt[wrapped] = dt[wrapped] + 2.**wrap_bits
+        
+        cut = np.logical_and(dt_min < absdt, 
+                absdt < dt_max[:,np.newaxis])
+        cut[dt_max == -1] = True
+        valid = np.logical_and(valid, cut)
+    
+    windows = np.zeros(valid.shape, dtype=int)
+    combinations = [ w1ch0len + w2ch0len == 2, w1ch0len + w2ch1len == 2,
+            w1ch1len + w2ch0len == 2, w1ch1len + w2ch1len == 2 ]
+    for w in range(4,0,-1):
+        windows[np.logical_and(valid, combinations[w-1])] = w
+    
+    if np.any(np.logical_and(valid, windows == 0)):
+        raise(Exception('Window correlation error'))
+
+    return windows
+
 # get the valid hhpludata;
 # filter for time, time difference between the two clicks
 # assume: only plu markers left in the data
@@ -162,6 +258,61 @@ def windowdata(hhpludat, w1_start=(0,0), w1_stop=(700,700),
 
     ch1_offset (=0):
         add this value to times registered on ch1, to balance for the dt comparrisson.
+
+    vectorized version of windowdata_slow (same result): the photons are
+    grouped by sync number, and the photons in the windows before/at
+    each marker are counted per channel with bincount.
+    """
+
+    single_photon_range_start=kw.pop('single_photon_range_start', w1_start)
+    single_photon_range_stop=kw.pop('single_photon_range_stop', w1_stop)
+
+    mrkr_syncs = hhpludat[hhpludat[:,3]==1,0].astype(np.int64)
+    
+    photons, syncs, group = _photon_groups(hhpludat)
+    n = len(syncs)
+
+    # photon groups of window 1 (sync before the marker) and window 2
+    g1 = _group_index(syncs, mrkr_syncs-1)
+    g2 = _group_index(syncs, mrkr_syncs)
+
+    w1ch0, t1ch0 = _window_counts(photons, group, n, 0, w1_start[0], w1_stop[0])
+    w1ch1, t1ch1 = _window_counts(photons, group, n, 1, w1_start[1], w1_stop[1])
+    w2ch0, t2ch0 = _window_counts(photons, group, n, 0, w2_start[0], w2_stop[0])
+    w2ch1, t2ch1 = _window_counts(photons, group, n, 1, w2_start[1], w2_stop[1])
+    spch0, _t = _window_counts(photons, group, n, 0, 
+            single_photon_range_start[0], single_photon_range_stop[0])
+    spch1, _t = _window_counts(photons, group, n, 1, 
+            single_photon_range_start[1], single_photon_range_stop[1])
+
+    lens = (w1ch0[g1], w1ch1[g1], w2ch0[g2], w2ch1[g2])
+    splens = (spch0[g1], spch1[g1], spch0[g2], spch1[g2])
+    t1 = np.where(lens[1] > 0, t1ch1[g1] + ch1_offset, t1ch0[g1])
+    t2 = np.where(lens[3] > 0, t2ch1[g2] + ch1_offset, t2ch0[g2])
+
+    windows = _window_codes(lens, splens, t1, t2, _wrap_bits(hhpludat), 
+            [dt_max], dt_min)[0]
+
+    return windows
+
+# get the valid hhpludata;
+# filter for time, time difference between the two clicks
+# assume: only plu markers left in the data
+# returns an array with the length of plu markers
+# that contains a 0 for each invalid event, and a 1 for each invalid event
+def windowdata_slow(hhpludat, w1_start=(0,0), w1_stop=(700,700),
+        w2_start=(0,0), w2_stop=(700,700), dt_max=-1,dt_min=-1, 
+        ch1_offset=0, **kw):
+    """
+    dt_max (=-1):
+        if =/= -1, filter on dt: if the time difference between the window 1 
+        and window 2 event is larger than dt_max, then we do not accept this
+        event as valid.
+
+    ch1_offset (=0):
+        add this value to times registered on ch1, to balance for the dt comparrisson.
+
+    reference implementation of windowdata (loops over the markers).
     """
 
     single_photon_range_start=kw.pop('single_photon_range_start', w1_start)
@@ -304,6 +455,95 @@ def windowdata(hhpludat, w1_start=(0,0), w1_stop=(700,700),
     return windows
 
 
+def window_table(hhpludat):
+    """
+    per plu marker in hhpludat, the photons in the sync of window 1 (the 
+    sync before the marker) and window 2 (the sync of the marker), such that
+    windowdata can be evaluated for many window settings without going 
+    through the raw data again (see window_sweep).
+    returns a dict with 'times' and 'channels' of shape 
+    (markers, 2, max. number of photons per sync), padded with channel -1, 
+    and 'wrap_bits'.
+    """
+    mrkr_syncs = hhpludat[hhpludat[:,3]==1,0].astype(np.int64)
+    photons, syncs, group = _photon_groups(hhpludat)
+    n = len(syncs)
+
+    # position of each photon within its sync
+    pos = np.arange(len(group)) - np.searchsorted(group, group)
+    width = pos.max()+1 if len(pos) > 0 else 1
+
+    # the extra last row is used for markers without photons in a window
+    times = np.zeros((n+1, width), dtype=np.int64)
+    channels = np.zeros((n+1, width), dtype=np.int64) - 1
+    times[group,pos] = photons[:,1]
+    channels[group,pos] = photons[:,2]
+
+    g = np.vstack((_group_index(syncs, mrkr_syncs-1), 
+        _group_index(syncs, mrkr_syncs))).T
+    
+    return { 'times' : times[g], 'channels' : channels[g],
+            'wrap_bits' : _wrap_bits(hhpludat), }
+
+def _table_window(table, w, ch, start, stop):
+    """
+    per marker: the number of photons on channel ch in window w (0 or 1)
+    with start < time < stop, and the time of the first of them (-1 if none).
+    """
+    t = table['times'][:,w]
+    inwin = np.logical_and(table['channels'][:,w] == ch,
+            np.logical_and(t > start, t < stop))
+    counts = inwin.sum(axis=1)
+    first = t[np.arange(len(t)), inwin.argmax(axis=1)]
+    return counts, np.where(counts > 0, first, -1)
+
+def window_sweep(table, SSROs_adwin_LT1, SSROs_adwin_LT2, w_starts, 
+        w_lengths, dts, dt_min=-1, ch1_offset=0, filter_ap=0):
+    """
+    the correlations (as from windowdata and correlations) for a whole grid
+    of window settings, from a window_table:
+
+    w_starts: list of window starts (ch0, ch1), used for both windows
+    w_lengths: list of window lengths, used for both windows
+    dts: list of dt_max cuts (-1: no cut)
+    
+    the single photon range is (start - filter_ap, stop of window 1), as in
+    LDEAnalysis.reanalyse_lde.
+    returns the uncond, 00, 01, 10, 11 correlations, each of shape 
+    (len(w_starts), len(w_lengths), len(dts), 4).
+    """
+    SSROs_adwin_LT1 = np.asarray(SSROs_adwin_LT1)
+    SSROs_adwin_LT2 = np.asarray(SSROs_adwin_LT2)
+    ssro = (SSROs_adwin_LT1 > 0)*2 + (SSROs_adwin_LT2 > 0)
+    good = np.logical_and(SSROs_adwin_LT1 >= 0, SSROs_adwin_LT2 >= 0)
+    noof_dts = len(dts)
+    
+    corr = np.zeros((len(w_starts), len(w_lengths), noof_dts, 5, 4), 
+            dtype=np.uint32)
+    for i,start in enumerate(w_starts):
+        for j,length in enumerate(w_lengths):
+            stop = (start[0]+length, start[1]+length)
+            w1ch0, t1ch0 = _table_window(table, 0, 0, start[0], stop[0])
+            w1ch1, t1ch1 = _table_window(table, 0, 1, start[1], stop[1])
+            w2ch0, t2ch0 = _table_window(table, 1, 0, start[0], stop[0])
+            w2ch1, t2ch1 = _table_window(table, 1, 1, start[1], stop[1])
+            splens = [ _table_window(table, w, ch, start[ch]-filter_ap, 
+                stop[ch])[0] for w in (0,1) for ch in (0,1) ]
+            
+            t1 = np.where(w1ch1 > 0, t1ch1 + ch1_offset, t1ch0)
+            t2 = np.where(w2ch1 > 0, t2ch1 + ch1_offset, t2ch0)
+            windows = _window_codes((w1ch0, w1ch1, w2ch0, w2ch1), splens,
+                    t1, t2, table['wrap_bits'], dts, dt_min)
+            
+            idx = windows[:,good]*4 + ssro[good]
+            idx += np.arange(noof_dts)[:,np.newaxis]*20
+            corr[i,j] = np.bincount(idx.ravel(), 
+                    minlength=noof_dts*20).reshape(noof_dts,5,4)
+    
+    uncond_corr = corr[...,1:,:].sum(axis=-2).astype(np.uint32)
+    return uncond_corr, corr[...,1,:], corr[...,2,:], corr[...,3,:], \
+            corr[...,4,:]
+
 # compute the spin-spin correlations from pre-filtered SSRO data
 # correlations come out as follows:
 # LT1 == 0 AND LT2 == 0 || == 0 AND > 0 || > 0 AND == 0 || > 0 AND > 0
@@ -378,10 +618,7 @@ def ssro_correct_twoqubit_state_photon_numbers(correlations, F0a, F0b, F1a, F1b,
     #if norm_corr.sum() != 1.0:
     #    print 'Correlations not normalized!: sum is: ', norm_corr.sum()
 
-    U = np.matrix([[F1a*F1b, F1a*(1-F0b), F1b*(1-F0a), (1-F0a)*(1-F0b)],
-            [F1a*(1-F1b), F1a*F0b, (1-F0a)*(1-F1b), F0b*(1-F0a)],
-            [F1b*(1-F1a), (1-F1a)*(1-F0b), F0a*F1b, F0a*(1-F0b)],
-            [(1-F1a)*(1-F1b), F0b*(1-F1a), F0a*(1-F1b), F0a*F0b]])
+    U = np.matrix(ro_c_err.error_matrix(F0a, F0b, F1a, F1b)[0])
 
     if np.linalg.det(U) != 0:
         Uinv = U.I
@@ -405,11 +642,27 @@ def ssro_correct_twoqubit_state_photon_numbers(correlations, F0a, F0b, F1a, F1b,
     
     return np.asarray(correlations_corrected)
 
+def readout_error_matrix(F0a, F0b, F1a, F1b):
+    """
+    the readout error matrix E (measured = E . actual) for the populations
+    in the order [00, 01, 10, 11], i.e., the matrix that is inverted in
+    ssro_correct_twoqubit_state_photon_numbers, in reversed order.
+    """
+    return ro_c_err.error_matrix(F0a, F0b, F1a, F1b)[0][..., ::-1, ::-1]
+
 def get_fidelity_error(correlations, F0a, F0b, F1a, F1b, dF0a=0.01, dF0b=0.01, dF1a=0.01, dF1b=0.01):
+    """
+    error of the readout corrected r01+r10. correlations may also be an 
+    array of shape (4, ...), e.g., for a grid of window settings.
+    """
     N11,N10,N01,N00=correlations
     return ro_c_err.get_summed_error(F0a, F0b, F1a, F1b, dF0a, dF0b, dF1a, dF1b, N00, N01, N10, N11)
     
 def get_fidelity_error_sqrt_ZZ(correlations, F0a, F0b, F1a, F1b, dF0a=0.01, dF0b=0.01, dF1a=0.01, dF1b=0.01):
+    """
+    error of the readout corrected sqrt(r00*r11); correlations may be 
+    of shape (4, ...) as for get_fidelity_error.
+    """
     N11,N10,N01,N00=correlations
     return ro_c_err.get_sqrt_product_error(F0a, F0b, F1a, F1b, dF0a, dF0b, dF1a, dF1b, N00, N01, N10, N11)
 
@@ -443,53 +696,93 @@ def plot_uncorrected(corr,err=np.array([0,0,0,0]),sav_fig=False,save_path=''):
     if sav_fig:
         fig2.savefig(save_path+'_uncorrected.png')
 
+def _double_click_pairs(raw_double_click_data):
+    """
+    first and second clicks (rows) of the consecutive-sync pairs in the
+    output of get_double_clicks.
+    """
+    data = np.asarray(raw_double_click_data).astype(np.int64)
+    if len(data) < 2:
+        return data[:0], data[:0]
+    pair = data[:-1,0]+1 == data[1:,0]
+    return data[:-1][pair], data[1:][pair]
+
+def double_click_statistics(raw_double_click_data, hist_size=700):
+    """
+    returns the channel signatures of the double clicks in the form
+    [ch0+ch0,ch1+ch0,ch0+ch1,ch1+ch1], the histogram of the signed dt's
+    (first - second click, bins -hist_size/2 ... hist_size/2-1) for each
+    signature (shape (4, hist_size)), and the number of dt's outside the
+    histogram for each signature.
+    """
+    first, second = _double_click_pairs(raw_double_click_data)
+    sig = first[:,2] + 2*second[:,2]
+    dt = first[:,1] - second[:,1] + hist_size/2
+    valid = np.logical_and(sig >= 0, sig < 4)
+    ok = np.logical_and(valid, np.logical_and(dt >= 0, dt < hist_size))
+    
+    channels = np.bincount(sig[valid], minlength=4)
+    dt_hist = np.bincount(sig[ok]*hist_size + dt[ok],
+            minlength=4*hist_size).reshape(4, hist_size)
+    out_of_range = np.bincount(sig[np.logical_and(valid, ~ok)], minlength=4)
+    return channels, dt_hist, out_of_range
+
+class DoubleClickStatistics:
+    """
+    double click statistics (see double_click_statistics), added up over 
+    all subruns in fixed-size arrays.
+    """
+
+    def __init__(self, hist_size=700):
+        self.hist_size = hist_size
+        self.dt = np.arange(hist_size) - hist_size/2
+        self.channels = np.zeros(4, dtype=np.int64)
+        self.dt_hist = np.zeros((4, hist_size), dtype=np.int64)
+        self.out_of_range = np.zeros(4, dtype=np.int64)
+        self.subruns = 0
+
+    def add(self, raw_double_click_data):
+        """
+        adds the double clicks of one subrun; returns its channel 
+        statistics.
+        """
+        channels, dt_hist, out_of_range = double_click_statistics(
+                raw_double_click_data, self.hist_size)
+        self.channels += channels
+        self.dt_hist += dt_hist
+        self.out_of_range += out_of_range
+        self.subruns += 1
+        return channels
+
 def get_channel_statistics(raw_double_click_data):
     """returns the division over windows/channels in the form
     [ch0+ch0,ch1+ch0,ch0+ch1,ch1+ch1]"""
 
-    data=raw_double_click_data
-    channels=np.zeros(4,dtype=np.uint32)
-    for i in np.arange(len(data)-1):
-        try:
-            if (data[i,0]+1==(data[i+1,0])):
-                channels[int(data[i,2]*2**0+data[i+1,2]*2**1)]+=1
-        except IndexError:
-            pass
-    return channels
+    return double_click_statistics(raw_double_click_data)[0].astype(np.uint32)
 
 def get_dt_hist(raw_double_click_data,hist_size=700):
 
     """returns a histogram of dt's between double clicks]"""
 
-    data=raw_double_click_data
-    histogram=np.zeros(hist_size,dtype=np.uint32)
-    for i in np.arange(len(data)-1):
-        try:
-            if (data[i,0]+1==(data[i+1,0])):
-                histogram[int(abs(data[i,1]-data[i+1,1]))]+=1
-        except IndexError:
-            print'dt outside histogram range'
-
-    return histogram
+    first, second = _double_click_pairs(raw_double_click_data)
+    dt = abs(first[:,1] - second[:,1])
+    if (dt >= hist_size).any():
+        print 'dt outside histogram range'
+    return np.bincount(dt[dt < hist_size], 
+            minlength=hist_size).astype(np.uint32)
 
 def get_dt_hist_vs_chan_stat(raw_double_click_data,hist_size=700):
 
     """returns a histogram of dt's between double clicks, 
     seperated to the different channel signatures
-     [ch0+ch0,ch1+ch0,ch0+ch1,ch1+ch1]"""
-
-    data=raw_double_click_data.astype(np.int32)
-    histogram=np.zeros((4,hist_size),dtype=np.int32)
-    for i in np.arange(len(data)-1):
-        try:
-            if (data[i,0]+1==(data[i+1,0])):
-                histogram[int(data[i,2]*2**0+data[i+1,2]*2**1),int(data[i,1]-data[i+1,1])+350]+=1
-                if int(data[i,1]-data[i+1,1])<0:
-                    print int(data[i,1]-data[i+1,1])
-        except IndexError:
-            print'dt outside histogram range'
-
-    return histogram
+     [ch0+ch0,ch1+ch0,ch0+ch1,ch1+ch1]; dt = first - second click,
+     offset by hist_size/2"""
+
+    channels, dt_hist, out_of_range = double_click_statistics(
+            raw_double_click_data, hist_size)
+    if out_of_range.sum() > 0:
+        print 'dt outside histogram range'
+    return dt_hist.astype(np.int32)
 
 
 # create some dummy data foanalr testing
@@ -38,27 +38,69 @@ def rename(path):
 
 
 # coincidence detection for a single folder
-# will get the coincidences for all rawdata .npz files in that folder
-def coincidences_from_folder(path, ch0window=(0,500), ch1window=(0,500), *arg, **kw):
+# will get the coincidences for all rawdata .npz files in that folder.
+# the files are processed one by one and the coincidences are only kept as
+# histograms (dt per delta, and ch0 time vs dt per delta), such that the
+# memory use does not grow with the amount of data.
+# after each file the partial sums are saved to <savepath>_partial.npz;
+# a later call with the same settings continues from there.
+def coincidences_from_folder(path, ch0window=(0,500), ch1window=(0,500), 
+        deltas=range(-3,4), *arg, **kw):
     
-    npzfiles = [ f for f in os.listdir(os.path.join(workingpath, path)) \
-            if ( os.path.splitext(f)[1] == '.npz' and 'alldata' in f and f[:1] != '.') ]
+    npzfiles = sorted([ f for f in os.listdir(os.path.join(workingpath, path)) \
+            if ( os.path.splitext(f)[1] == '.npz' and 'alldata' in f and f[:1] != '.') ])
    
     sync_range = kw.pop('sync_range', range(1, 301))
+    binsize = kw.pop('binsize', 1)
     ret = kw.pop('ret', True)
-   
-    totalhist=np.array([0,0], dtype=np.uint32)
-    #totalhist = np.array([], dtype=int)
+    resume = kw.pop('resume', True)
+    
+    base = path
+    p = os.path.join(workingpath, '%s_coincidences_syncs_%d-%d_ch0_%d-%d_ch1_%d-%d' % \
+                (base, sync_range[0], sync_range[-1], ch0window[0], ch0window[1], ch1window[0], ch1window[1]))
+    checkpoint = p + '_partial.npz'
+
+    # fixed binning: dt = ch0 time - ch1 time, in units of HH bins
+    dt_binedges = np.arange(ch0window[0]-ch1window[1], 
+            ch0window[1]-ch1window[0]+binsize+1, binsize)
+    t_binedges = np.arange(ch0window[0], ch0window[1]+binsize+1, binsize)
+    
+    settings = dict(deltas=np.array(deltas), sync_range=np.array(sync_range),
+            ch0window=np.array(ch0window), ch1window=np.array(ch1window),
+            binsize=binsize)
+    
+    done = []
+    clicks = np.zeros(2, dtype=np.uint64)
+    dt_hist = np.zeros((len(deltas), len(dt_binedges)-1), dtype=np.uint64)
+    hist2d = np.zeros((len(deltas), len(t_binedges)-1, len(dt_binedges)-1), 
+            dtype=np.uint64)
+
+    if resume and os.path.exists(checkpoint):
+        try:
+            d = np.load(checkpoint)
+            match = np.all([ np.array_equal(d[k], v) \
+                    for k,v in settings.items() ])
+            if match:
+                saved = list(d['files']), d['clicks'], d['dt_hist'], \
+                        d['hist2d'].astype(np.uint64)
+            d.close()
+        except Exception:
+            # e.g., a checkpoint truncated while it was written
+            match = False
+        
+        if match:
+            done, clicks, dt_hist, hist2d = saved
+            print 'resume from %s (%d files done)' % (checkpoint, len(done))
+        else:
+            print 'cannot resume from %s, start over' % checkpoint
+
     for i,f in enumerate(npzfiles):
+        if f in done:
+            continue
+        
         print ''
         print 'file', f
 
-        # brute force for now: ignore the first file of each measurement.
-        # if os.path.splitext(f)[0][-3:] == '-0':
-        #     print 'IGNORED; FIND BETTER WAY...'
-        #     continue
-
-        base = path
         d = np.load(os.path.join(workingpath, path, f))
         raw = d['data'].astype(np.uint)
         d.close()
@@ -69,41 +111,83 @@ def coincidences_from_folder(path, ch0window=(0,500), ch1window=(0,500), *arg, *
         # print 'filter on timewindow'
         data = hht3.filter_timewindow(data, 0, mintime=ch0window[0], maxtime=ch0window[1])
         data = hht3.filter_timewindow(data, 1, mintime=ch1window[0], maxtime=ch1window[1])
-        if len(data) == 0:
-            continue
-
-        data = hht3.filter_decreasing_syncs(data)
-        if len(data) == 0:
-            continue
-
+        if len(data) > 0:
+            data = hht3.filter_decreasing_syncs(data)
+        
         # print 'filter counts on markers'
-        data = filter_markers(data, sync_range=sync_range)
-        if len(data) == 0:
-            continue
+        if len(data) > 0:
+            data = filter_markers(data, sync_range=sync_range)
         
-        t0, t1 = hht3.get_clicks(data)
-
-
-        # print 'extract coincidences'
-        #deltas, c = coincidences(data, *arg, **kw)
-
-        #print '* Coincidences for %s:' % f, [ len(_c) for _c in c ]
-        #print ''
-
-        totalhist= totalhist+np.array([len(t0),len(t1)])
-        print totalhist
-        #totalhist = add_coincidences(totalhist, c)
-    
-    p = os.path.join(workingpath, '%s_coincidences_syncs_%d-%d_ch0_%d-%d_ch1_%d-%d' % \
-                (base, sync_range[0], sync_range[-1], ch0window[0], ch0window[1], ch1window[0], ch1window[1]))
+        if len(data) > 0:
+            # print 'extract coincidences'
+            _clicks, _dt_hist, _hist2d = coincidence_hists(data, deltas, 
+                    dt_binedges, t_binedges)
+            clicks += _clicks.astype(np.uint64)
+            dt_hist += _dt_hist.astype(np.uint64)
+            hist2d += _hist2d.astype(np.uint64)
+
+            print '* Coincidences for %s:' % f, _dt_hist.sum(-1)
+            print ''
+
+        done.append(f)
+        # write to a temporary file first, such that an interruption while
+        # saving does not destroy the previous checkpoint
+        tmp = checkpoint + '.tmp'
+        with open(tmp, 'wb') as cf:
+            np.savez(cf, files=np.array(done), clicks=clicks, 
+                    dt_hist=dt_hist, hist2d=hist2d, **settings)
+        if os.path.exists(checkpoint):
+            os.remove(checkpoint)
+        os.rename(tmp, checkpoint)
+        
+    np.savez(p, deltas=deltas, dt_binedges=dt_binedges, t_binedges=t_binedges,
+            clicks=clicks, coincidences=dt_hist, hist2d=hist2d, 
+            files=np.array(done))
+    if os.path.exists(checkpoint):
+        os.remove(checkpoint)
 
-    np.savez(p, deltas=deltas, coincidences=totalhist)
-    plot_g2(deltas, totalhist, savepath=p+'.png', 
+    plot_g2_hist(deltas, dt_binedges, dt_hist, savepath=p+'.png', 
         title='%s; windows: %d-%d, %d-%d; syncs: %d-%d' % (path, 
             ch0window[0], ch0window[1], ch1window[0], ch1window[1], sync_range[0], sync_range[-1]))
 
     if ret:
-        return deltas, totalhist
+        return deltas, dt_hist, hist2d
+
+def coincidence_hists(data, deltas, dt_binedges, t_binedges):
+    '''
+    histograms the coincidences in data (see coincidences) with
+    uniform integer binning. returns the number of clicks on (ch0, ch1),
+    the dt histograms (deltas x dt bins), and the 2d histograms of ch0
+    time vs dt (deltas x time bins x dt bins); coincidences outside the
+    bins are dropped.
+    '''
+    clicks = np.zeros(2, dtype=int)
+    dt_hist = np.zeros((len(deltas), len(dt_binedges)-1), dtype=int)
+    hist2d = np.zeros((len(deltas), len(t_binedges)-1, len(dt_binedges)-1), 
+            dtype=int)
+    
+    t0, t1 = hht3.get_clicks(data)
+    if t0.shape == (4,0) or t1.shape == (4,0):
+        return clicks, dt_hist, hist2d
+    
+    clicks[:] = len(t0), len(t1)
+    t0 = t0.astype(int)
+    t1 = t1.astype(int)
+    ndt = dt_hist.shape[1]
+    nt = hist2d.shape[1]
+    dt_binsize = dt_binedges[1] - dt_binedges[0]
+    t_binsize = t_binedges[1] - t_binedges[0]
+    
+    for k, (i0, i1) in enumerate(_coincidence_pairs(t0, t1, deltas)):
+        dt_idx = (t0[i0,1] - t1[i1,1] - dt_binedges[0]) // dt_binsize
+        t_idx = (t0[i0,1] - t_binedges[0]) // t_binsize
+        inside = (dt_idx >= 0) & (dt_idx < ndt) & (t_idx >= 0) & (t_idx < nt)
+        
+        idx = t_idx[inside] * ndt + dt_idx[inside]
+        hist2d[k] = np.bincount(idx, minlength=nt*ndt).reshape(nt, ndt)
+        dt_hist[k] = hist2d[k].sum(0)
+
+    return clicks, dt_hist, hist2d
 
 
 def add_coincidences(c1, c2):
@@ -135,9 +219,11 @@ def coincidences(data, deltas=range(-3,4), *arg, **kw):
     if t0.shape == (4,0) or t1.shape == (4,0):
         return deltas, [np.array([], dtype=int) for d in deltas]
 
+    t0 = t0.astype(int)
+    t1 = t1.astype(int)
     c = []
-    for delta in deltas:
-        c.append(_coincidences(t0.astype(int),t1.astype(int),delta))
+    for i0, i1 in _coincidence_pairs(t0, t1, deltas):
+        c.append(t0[i0,1] - t1[i1,1])
 
     return deltas, c
 
@@ -147,13 +233,44 @@ def coincidence_times(data, deltas=range(-3,4), *arg, **kw):
     if t0.shape == (4,0) or t1.shape == (4,0):
         return deltas, [ np.zeros((0,2)) for d in deltas ]
 
+    t0 = t0.astype(int)
+    t1 = t1.astype(int)
     c = []
-    for delta in deltas:
-        c.append(_coincidence_times(t0.astype(int), t1.astype(int), delta))
+    for i0, i1 in _coincidence_pairs(t0, t1, deltas):
+        c.append(np.vstack((t0[i0,1], t1[i1,1])).T.astype(float))
 
     return deltas, c
 
 
+def _coincidence_pairs(t0, t1, deltas):
+    '''
+    merge-join of ch0 and ch1 clicks on the sync number, for all deltas
+    at once.
+    returns a list with, for each delta, the index arrays (i0, i1) of all
+    pairs with sync(ch1) == sync(ch0) + delta. if a sync has several
+    clicks, every ch0 click is paired with every ch1 click; pairs are
+    ordered by ch0 click, then by ch1 click (as in _coincidences_slow).
+    '''
+    deltas = np.asarray(deltas, dtype=int)
+    if len(deltas) == 0:
+        return []
+
+    # a stable sort keeps the ch1 clicks of one sync in their original order
+    order = np.argsort(t1[:,0], kind='mergesort')
+    syncs1 = t1[order,0]
+    keys = t0[:,0][np.newaxis,:] + deltas[:,np.newaxis]
+    lo = np.searchsorted(syncs1, keys, side='left').ravel()
+    n = np.searchsorted(syncs1, keys, side='right').ravel() - lo
+    
+    # expand each ch0 click into its run of matching ch1 clicks
+    starts = np.cumsum(n) - n
+    npairs = int(n.sum())
+    i0 = np.repeat(np.tile(np.arange(len(t0)), len(deltas)), n)
+    i1 = order[np.repeat(lo - starts, n) + np.arange(npairs)]
+
+    splits = np.cumsum(n.reshape(len(deltas), len(t0)).sum(axis=1))[:-1]
+    return zip(np.split(i0, splits), np.split(i1, splits))
+
 def _coincidence_times(t0, t1, delta=0, *arg, **kw):
     '''
     returns coincidences from lists of ch0 and ch1 photons,
@@ -161,6 +278,22 @@ def _coincidence_times(t0, t1, delta=0, *arg, **kw):
     each coincidence is a row containing (ch0_time, ch1_time) in a
     Nx2 array.
     '''
+    i0, i1 = _coincidence_pairs(t0, t1, [delta])[0]
+    return np.vstack((t0[i0,1], t1[i1,1])).T.astype(float)
+
+def _coincidences(t0, t1, delta=0, *arg, **kw):
+    '''
+    returns the time differences (ch0 - ch1) of all coincidences
+    for the specified delta.
+    '''
+    i0, i1 = _coincidence_pairs(t0, t1, [delta])[0]
+    return t0[i0,1] - t1[i1,1]
+
+def _coincidence_times_slow(t0, t1, delta=0, *arg, **kw):
+    '''
+    loop-based version of _coincidence_times; slow, but useful as
+    a reference.
+    '''
     hist = np.zeros((0,2))
     ch0, ch1 = _coincidence_clicks(t0, t1, delta=delta, *arg, **kw)
     
@@ -175,8 +308,10 @@ def _coincidence_times(t0, t1, delta=0, *arg, **kw):
     
     return hist 
 
-def _coincidences(t0, t1, delta=0, *arg, **kw):
-    
+def _coincidences_slow(t0, t1, delta=0, *arg, **kw):
+    '''
+    loop-based version of _coincidences; slow, but useful as a reference.
+    '''
     hist = np.array([], dtype=int)
     ch0, ch1 = _coincidence_clicks(t0, t1, delta=delta, *arg, **kw)
     
@@ -244,6 +379,36 @@ def plot_g2(deltas, dts, time_per_bin=0.256, delta_separation_time=200,
         fig.savefig(savepath)
 
 
+def plot_g2_hist(deltas, binedges, hists, time_per_bin=0.256,
+        delta_separation_time=200, *arg, **kw):
+    '''
+    like plot_g2, but for histogrammed coincidences (deltas x bins,
+    as from coincidence_hists).
+    '''
+    savepath = kw.pop('savepath', None)
+    title = kw.pop('title', None)
+
+    fig = plt.figure()
+    ax = plt.subplot(111)
+    for d,h in zip(deltas, hists):
+        ax.step(binedges[:-1]*time_per_bin + d*delta_separation_time, h,
+                where='post', c='k')
+    plt.xlabel('time')
+    plt.ylabel('occurences')
+    ylim_old = ax.get_ylim()[1]
+    ylim_new = ylim_old * 1.1
+    ax.set_ylim((0,ylim_new))
+
+    if title != None:
+        plt.title(title)
+
+    for d,h in zip(deltas,hists):
+        plt.text(d*delta_separation_time, ylim_old*1.05, '%d' % h.sum(), ha='center')
+
+    if savepath != None:
+        fig.savefig(savepath)
+
+
 def plot_counts_vs_time(data, rng=500.):
     
     fig = plt.figure()
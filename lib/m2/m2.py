@@ -6,6 +6,136 @@ import h5py
 from matplotlib import pyplot as plt
 from analysis.lib.tools import toolbox
 
+# number of elements read at once by the chunked reductions
+CHUNKSIZE = 2**22
+
+class DatasetView:
+    """
+    lazy, read-only view of an hdf5 dataset, optionally reshaped 
+    (e.g., the flat RO_data to reps x bins). nothing is read on creation.
+    contiguous, uncompressed datasets are memory mapped; otherwise 
+    indexing with row slices reads only the required rows via h5py, and
+    other indices read the whole dataset. if the file gets closed (e.g., 
+    by M2Analysis.finish) it is reopened read-only for each read.
+    use iter_rows and the reductions below to process large data in chunks.
+    """
+
+    def __init__(self, ds, shape=None, mmap=True):
+        self.ds = ds
+        self.filename = ds.file.filename
+        self.name = ds.name
+        self.shape = tuple(shape) if shape != None else ds.shape
+        self.dtype = ds.dtype
+        self.ndim = len(self.shape)
+        self.size = int(np.prod(self.shape))
+        self.rowsize = int(np.prod(self.shape[1:]))
+        
+        if self.size > ds.size:
+            raise ValueError('cannot view %d elements as %s' % \
+                    (ds.size, str(self.shape)))
+
+        self.mmap = None
+        offset = ds.id.get_offset()
+        if mmap and ds.chunks == None and ds.compression == None and \
+                offset is not None and self.size > 0:
+            self.mmap = np.memmap(ds.file.filename, dtype=ds.dtype, mode='r',
+                    offset=offset, shape=self.size).reshape(self.shape)
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, key):
+        if self.mmap is not None:
+            return np.asarray(self.mmap[key])
+
+        rows = key[0] if type(key) == tuple else key
+        rest = (slice(None),) + key[1:] if type(key) == tuple else ()
+        if type(rows) in (int, long, np.int32, np.int64):
+            i = rows if rows >= 0 else rows + len(self)
+            if i < 0 or i >= len(self):
+                raise IndexError('index %d out of range' % rows)
+            return self._read(i, i+1)[rest][0]
+        
+        if type(rows) == slice and rows.step in (None, 1):
+            start, stop, step = rows.indices(len(self))
+            return self._read(start, max(start, stop))[rest]
+
+        return self.read()[key]
+
+    def __array__(self, dtype=None):
+        if dtype == None:
+            return self.read()
+        return self.read().astype(dtype)
+
+    def _read(self, start, stop):
+        rows = slice(start*self.rowsize, stop*self.rowsize)
+        if self.ds.id.valid:
+            flat = self.ds[rows]
+        else:
+            # the file has been closed; open it only for this read, such
+            # that no handle stays open
+            with h5py.File(self.filename, 'r') as f:
+                flat = f[self.name][rows]
+        return flat.reshape((stop-start,) + self.shape[1:])
+
+    def read(self):
+        """
+        load the full data into memory.
+        """
+        return self[0:len(self)]
+
+
+def iter_rows(data, chunksize=CHUNKSIZE):
+    """
+    iterate over data (array or DatasetView) in blocks of rows, with about
+    chunksize elements per block.
+    """
+    rowsize = int(np.prod(data.shape[1:]))
+    n = max(1, chunksize / max(1, rowsize))
+    for i in range(0, len(data), n):
+        yield data[i:i+n]
+
+def reduce_rows(data, func, chunksize=CHUNKSIZE):
+    """
+    sum of func(block) over all row blocks of data, see iter_rows.
+    returns None for empty data.
+    """
+    result = None
+    for block in iter_rows(data, chunksize):
+        r = func(block)
+        result = r if result is None else result + r
+    return result
+
+def reps_sum(data, firstbin=0, lastbin=None, chunksize=CHUNKSIZE):
+    """
+    sum over the repetitions (rows) of data[:,firstbin:lastbin].
+    """
+    s = reduce_rows(data, lambda b: np.sum(b[:,firstbin:lastbin], axis=0),
+            chunksize)
+    if s is None:
+        empty = np.zeros((0,) + tuple(data.shape[1:]), dtype=int)
+        return np.sum(empty[:,firstbin:lastbin], axis=0)
+    return s
+
+def shot_sums(data, firstbin=0, lastbin=None, chunksize=CHUNKSIZE):
+    """
+    sum of data[:,firstbin:lastbin] for each repetition (row).
+    """
+    return np.concatenate([np.zeros(0, dtype=int)] + \
+            [ np.sum(b[:,firstbin:lastbin], axis=1) \
+                for b in iter_rows(data, chunksize) ])
+
+def zero_counts_cumulative(data, chunksize=CHUNKSIZE):
+    """
+    for each bin, the number of repetitions (rows) without any counts
+    up to and including that bin.
+    """
+    z = reduce_rows(data, lambda b: np.sum(np.cumsum(b, axis=1)==0, axis=0),
+            chunksize)
+    if z is None:
+        return np.zeros(data.shape[1], dtype=int)
+    return z
+
 
 class M2Analysis:
 
@@ -43,6 +173,16 @@ class M2Analysis:
 
         return self.g[adwingrpname]
 
+    def dataset(self, ds, shape=None, **kw):
+        """
+        lazy view (DatasetView) of a dataset of the measurement, optionally
+        reshaped; ds is a dataset or a path relative to the measurement 
+        group.
+        """
+        if type(ds) in (str, unicode):
+            ds = self.g[ds]
+        return DatasetView(ds, shape=shape, **kw)
+
     def analysis_h5data(self, name='analysis'):
         if not os.path.exists(os.path.join(self.folder, name+'.hdf5')):
             mode = 'w'    
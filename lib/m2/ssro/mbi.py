@@ -70,19 +70,21 @@ class MBIAnalysis(m2.M2Analysis):
             results = adwingrp['ssro_results'].value
 
         _res = results.reshape((-1,self.pts,self.readouts))
-        c = np.zeros((self.reps, self.pts))
+        c = np.zeros((self.reps, self.pts), dtype=np.int64)
         
         #Here we make sure that outcomes are ordered such that in the example of 2 RO's 
         #(RO1,RO2)=('e','N') -> c -> repr  is 
         #(1,1) -> 3 -> 11; (1,0) -> 1 -> 01 ; (0,1) -> 2 -> 10 , (0,0) ->0 -> 00 
         for i in range(self.readouts):
-            c += 2**i * (1-_res[:,:,i])
+            c += 2**i * (1-_res[:,:,i].astype(np.int64))
 
+        # count all (point, correlation) pairs at once
         corrvals = range(2**self.readouts)
-        self.correlations = np.zeros((self.pts, len(corrvals)))
-        for v in corrvals:
-            for p in range(self.pts):
-                self.correlations[p,v] = len(np.where(c[:,p]==v)[0])
+        valid = np.logical_and(c >= 0, c < len(corrvals))
+        idx = (np.arange(self.pts)*len(corrvals) + c)[valid]
+        self.correlations = np.bincount(idx, 
+                minlength=self.pts*len(corrvals)).reshape(
+                        (self.pts, len(corrvals))).astype(float)
         
         #The correlations are ordered in the order Ne, in binary rep: 00,01,10,11 respectively.
         _cnames = [np.binary_repr(
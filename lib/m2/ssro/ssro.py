@@ -30,6 +30,33 @@ def get_SSRO_calibration(folder, readout_time):
 
     return f0, u_f0, f1, u_f1
 
+def get_pzero(ro_counts, reps, lastbin=None):
+    """
+    the probability to get zero counts in a shot, for the readout times
+    1..lastbin-1 (in bins), from the RO counts of shape (reps, bins)
+    (array or lazy m2.DatasetView, processed in chunks of reps).
+    """
+    if lastbin == None:
+        lastbin = ro_counts.shape[1]
+    bins = np.arange(1,lastbin)
+    
+    # number of shots without counts up to each readout time
+    noof_zeros = m2.zero_counts_cumulative(ro_counts)
+    if len(noof_zeros) == 0:
+        return np.ones(len(bins))
+    return noof_zeros[np.minimum(bins, len(noof_zeros))-1]/float(reps)
+
+def get_threshold_stats(folder, name='thresholds'):
+    """
+    load the results of SSROAnalysis.threshold_stats from analysis.hdf5, 
+    without touching the raw data. returns a dict of arrays.
+    """
+    fp = os.path.join(folder, 'analysis.hdf5')
+    f = h5py.File(fp, 'r')
+    stats = dict([ (k, v.value) for k,v in f[name].items() ])
+    f.close()
+    return stats
+
 # analysis classes and shortcut functions
 class SSROAnalysis(m2.M2Analysis):
     
@@ -46,18 +73,27 @@ class SSROAnalysis(m2.M2Analysis):
                 self.cycle_duration * 10./3.
 
         self.binsize = grp.attrs['cycle_duration']/300.
-        self.ro_counts = grp['RO_data'].value.reshape(
-                self.reps, grp.attrs['SSRO_duration'])
+        # lazy view, the RO data is only read (in chunks) by the analyses;
+        # ro_counts, the full array, is only loaded when used
+        self.ro_data = self.dataset(grp['RO_data'], 
+                shape=(self.reps, grp.attrs['SSRO_duration']))
+        self.__dict__.pop('ro_counts', None)
         self.cr_counts = grp['CR_after'].value
         self.sp_counts = grp['SP_hist'].value
 
+    def __getattr__(self, name):
+        if name == 'ro_counts' and 'ro_data' in self.__dict__:
+            self.ro_counts = self.ro_data.read()
+            return self.ro_counts
+        raise AttributeError(name)
+
     def cpsh_hist(self, ro_counts, reps, firstbin=0, lastbin=-1, plot=True, **kw):
         name = kw.pop('name', '')
  
         title_suffix = ': '+name if name != '' else ''
         fn_suffix = '_'+name if name != '' else ''
 
-        cpsh = np.sum(ro_counts[:,firstbin:lastbin], axis=1)
+        cpsh = m2.shot_sums(ro_counts, firstbin, lastbin)
 
         annotation = 'repetitions: %d' % reps
         mean_cpsh = sum(cpsh)/float(reps)
@@ -91,7 +127,7 @@ class SSROAnalysis(m2.M2Analysis):
         title_suffix = ': '+name if name != '' else ''
         fn_suffix = '_'+name if name != '' else ''
 
-        ro_countrate = np.sum(ro_counts[:,:lastbin], axis=0) / \
+        ro_countrate = m2.reps_sum(ro_counts, 0, lastbin) / \
                 (binsize*1e-6*reps)
         ro_time = ro_time[:lastbin]
 
@@ -165,23 +201,15 @@ class SSROAnalysis(m2.M2Analysis):
         dataset_name = name if name != '' else 'fidelity'
 
         if lastbin == None:
-            lastbin = len(ro_counts[0,:])
-
-        fid_dat = np.zeros((0,3))
+            lastbin = ro_counts.shape[1]
 
-        for i in range(1,lastbin):
-            t = i*binsize
-            
-            # d: hist of counts, c: counts per shot
-            d = np.sum(ro_counts[:,:i], axis=1)
-            c = np.sum(d)/float(reps)
-
-            # we get the fidelity from the probability to get zero counts in a
-            # shot 
-            pzero = len(np.where(d==0)[0])/float(reps)
-            pzero_err = np.sqrt(pzero*(1-pzero)/reps)
-            fid = 1-pzero if ms == 0 else pzero # fidelity calc. depends on ms
-            fid_dat = np.vstack((fid_dat, np.array([[t, fid, pzero_err]])))
+        # we get the fidelity from the probability to get zero counts in a
+        # shot 
+        bins = np.arange(1,lastbin)
+        pzero = get_pzero(ro_counts, reps, lastbin)
+        pzero_err = np.sqrt(pzero*(1-pzero)/reps)
+        fid = 1-pzero if ms == 0 else pzero # fidelity calc. depends on ms
+        fid_dat = np.vstack((bins*binsize, fid, pzero_err)).T
 
         if save:
             f = self.analysis_h5data()
@@ -211,6 +239,88 @@ class SSROAnalysis(m2.M2Analysis):
             return fid_dat
 
 
+    def threshold_stats(self, max_cr=-1, lastbin=None, save=True, **kw):
+        """
+        CR and readout statistics for all threshold groups 
+        (th_pres_<preselect>_probe_<probe>...) of the measurement, read in a 
+        single pass over the file. returns a dict with, stacked over the 
+        groups (sorted by preselect and probe threshold):
+
+        names, preselect, probe, reps
+        cr_hist: normed histogram of the CR counts after the sequence
+        cr_mean, cr_std: mean and spread of the non-zero CR counts
+        cr_pass: percentage of CR checks passed (completed reps vs. fails)
+        ro_time, pzero: probability for zero counts in a shot vs readout
+            time (fidelity is 1-pzero for ms=0 and pzero for ms=1)
+        ro_countrate: readout count rate vs readout time (Hz)
+
+        if save, the result is stored in the group 'thresholds' of 
+        analysis.hdf5 (see get_threshold_stats).
+        """
+        prefix = kw.pop('prefix', 'th_pres_')
+        
+        names = sorted([ n for n in self.g.keys() if n.startswith(prefix) ],
+                key=lambda n: (float(n.split('_')[2]), float(n.split('_')[4])))
+        noof_groups = len(names)
+        
+        reps = np.zeros(noof_groups, dtype=int)
+        fails = np.zeros(noof_groups)
+        cr_counts = []
+        pzeros = []
+        countrates = []
+        for i,n in enumerate(names):
+            self.get_run(n)
+            reps[i] = self.reps
+            fails[i] = self.adwingrp(n)['statistics'].value[2]
+            cr_counts.append(self.cr_counts.astype(int))
+            pzeros.append(get_pzero(self.ro_data, self.reps, lastbin))
+            countrates.append(m2.reps_sum(self.ro_data) / \
+                    (self.binsize*1e-6*self.reps))
+        
+        if max_cr < 0:
+            max_cr = max([0] + [ np.max(cr) for cr in cr_counts if len(cr)>0 ])
+        
+        # groups may have different readout durations; pad with nan
+        nbins = max([0] + [ len(p) for p in pzeros ])
+        nrobins = max([0] + [ len(c) for c in countrates ])
+        stats = {
+            'names' : np.array(names, dtype=str),
+            'preselect' : np.array([ float(n.split('_')[2]) for n in names ]),
+            'probe' : np.array([ float(n.split('_')[4]) for n in names ]),
+            'reps' : reps,
+            'cr_hist' : np.zeros((noof_groups, max_cr+1)),
+            'cr_mean' : np.zeros(noof_groups),
+            'cr_std' : np.zeros(noof_groups),
+            'cr_pass' : reps/(reps + fails) * 100.,
+            'ro_time' : np.arange(1,nbins+1)*self.binsize,
+            'pzero' : np.zeros((noof_groups, nbins)) + np.nan,
+            'ro_countrate' : np.zeros((noof_groups, nrobins)) + np.nan,
+            }
+        
+        for i,cr in enumerate(cr_counts):
+            h = np.bincount(cr[np.logical_and(cr >= 0, cr <= max_cr)], 
+                    minlength=max_cr+1)
+            if np.sum(h) > 0:
+                stats['cr_hist'][i] = h/float(np.sum(h))
+            nonzero = cr[cr > 0]
+            if len(nonzero) > 0:
+                stats['cr_mean'][i] = float(np.sum(nonzero))/len(nonzero)
+                stats['cr_std'][i] = np.sqrt(np.sum((nonzero - \
+                        stats['cr_mean'][i])**2)/len(nonzero))
+            stats['pzero'][i,:len(pzeros[i])] = pzeros[i]
+            stats['ro_countrate'][i,:len(countrates[i])] = countrates[i]
+
+        if save:
+            f = self.analysis_h5data()
+            if 'thresholds' in f:
+                del f['thresholds']
+            g = f.create_group('thresholds')
+            for k in stats:
+                g[k] = stats[k]
+            f.close()
+
+        return stats
+
     def mean_fidelity(self, plot=True, **kw):
         
         f = self.analysis_h5data()
@@ -273,50 +383,26 @@ def ssrocalib(folder=''):
     
     for n,ms in zip(['ms0', 'ms1'], [0,1]): #zip((['ms0'], [0]):#
         a.get_run(n)
-        a.cpsh_hist(a.ro_counts, a.reps, name=n)
-        a.readout_relaxation(a.ro_time, a.ro_counts, a.reps, a.binsize, name=n)
+        a.cpsh_hist(a.ro_data, a.reps, name=n)
+        a.readout_relaxation(a.ro_time, a.ro_data, a.reps, a.binsize, name=n)
         a.spinpumping(a.sp_time, a.sp_counts, a.reps, a.binsize, name=n)
         a.charge_hist(a.cr_counts, name=n)
-        a.fidelity(a.ro_counts, a.reps, a.binsize, ms, name=n)
+        a.fidelity(a.ro_data, a.reps, a.binsize, ms, name=n)
     
     plt.close('all')
     a.mean_fidelity()
     a.finish()
 
-def thcalib(folder='', analyze_probe = False):
+def thcalib(folder='', analyze_probe = False, save=True):
     if folder=='':
         folder=toolbox.latest_data('AdwinSSRO')
     a = SSROAnalysis(folder)
-    
-    if analyze_probe:
-        ths = [1,2,3,4,6,8,10,15,20,25,30]
-    else:
-        ths = np.linspace(5,45,9)
-
-    for i,th in enumerate(ths):
-        
-        if analyze_probe:
-            name = 'th_pres_{}_probe_{}'.format(pres[0],th)
-        else:
-            name = 'th_pres_{}_probe_{}'.format(th,th)
-        
-        a = sequence.SequenceAnalysis(folder)
-        a.get_cr_results(name, plot=True)
-        plt.close('all')
-
-        mean = a.get_mean_cr_cts()
-        means.append(mean)
-        
-        stats = a.adwingrp(name)['statistics'].value
-        fail = stats[2]
-        percentage_pass = 5000./(5000. + fail) * 100 #5000 is the number of succesfull measurements.
-        percentage_passes.append(percentage_pass)
-
-        a.finish()
+    stats = a.threshold_stats()
+    ths = stats['probe'] if analyze_probe else stats['preselect']
 
     fig = a.default_fig(figsize=(6,4))
     ax = a.default_ax(fig)
-    ax.plot(ths, means,'o')
+    ax.plot(ths, stats['cr_mean'],'o')
     ax.set_xlabel('sweep threshold')
     ax.set_ylabel('mean CR counts after sequence')
     if save:
@@ -326,7 +412,7 @@ def thcalib(folder='', analyze_probe = False):
 
     fig = a.default_fig(figsize=(6,4))
     ax = a.default_ax(fig)
-    ax.plot(ths[:], percentage_passes[:],'o')
+    ax.plot(ths, stats['cr_pass'],'o')
     ax.set_xlabel('sweep threshold')
     ax.set_ylabel('percentage CR passes')
     if save:
@@ -334,28 +420,19 @@ def thcalib(folder='', analyze_probe = False):
             os.path.join(folder, 'percentage_CR_pass_vs_sweepparam.png'),
             format='png')
 
-
-
-
-
-
-
-
-    for n,th in zip(['th_pres_30.0_probe_30.0', 'th_pres_40.0_probe_40.0', 
-            'th_pres_50.0_probe_50.0','th_pres_60.0_probe_60.0',
-            'th_pres_70.0_probe_70.0','th_pres_80.0_probe_80.0',
-            'th_pres_90.0_probe_90.0','th_pres_100.0_probe_100.0',
-            'th_pres_110.0_probe_110.0','th_pres_120.0_probe_120.0'], [30,40,50,60,70,80,90,100,110,120]): #zip((['ms0'], [0]):#
-        a.get_run(n)
-        a.cpsh_hist(a.ro_counts, a.reps, name=n)
-        a.readout_relaxation(a.ro_time, a.ro_counts, a.reps, a.binsize, name=n)
-        a.spinpumping(a.sp_time, a.sp_counts, a.reps, a.binsize, name=n)
-        a.charge_hist(a.cr_counts, name=n)
-        a.fidelity(a.ro_counts, a.reps, a.binsize, th, name=n)
+    fig = a.default_fig(figsize=(6,4))
+    ax = a.default_ax(fig)
+    ax.plot(ths, stats['pzero'][:,-1],'o')
+    ax.set_xlabel('sweep threshold')
+    ax.set_ylabel('p(0 counts) at t = %.0f us' % stats['ro_time'][-1])
+    if save:
+        fig.savefig(
+            os.path.join(folder, 'pzero_vs_sweepparam.png'),
+            format='png')
     
     plt.close('all')
     a.finish()
-
+    return stats
     
 class AWGSSROAnalysis(m2.M2Analysis):
 
@@ -365,15 +442,29 @@ class AWGSSROAnalysis(m2.M2Analysis):
         self.reps = grp['completed_reps'].value
         self.pts = grp.attrs['pts']
         self.times = self.g.attrs['AWG_SSRO_durations']
-        self.counts = grp['RO_data'].value.reshape((-1,self.pts))
-
-        self.count_probability = np.array([float(len(np.where(self.counts[:,i]>0)[0])) \
-                for i in range(self.pts)]) / grp.attrs['SSRO_repetitions']
+        # lazy view, read in chunks; counts, the full array, is only 
+        # loaded when used
+        self.count_data = self.dataset(grp['RO_data'], 
+                shape=(grp['RO_data'].size/self.pts, self.pts))
+        self.__dict__.pop('counts', None)
+
+        nonzero = m2.reduce_rows(self.count_data, 
+                lambda b: np.sum(b>0, axis=0))
+        if nonzero is None:
+            nonzero = np.zeros(self.pts, dtype=int)
+        self.count_probability = nonzero.astype(float) / \
+                grp.attrs['SSRO_repetitions']
 
         self.u_count_probability = np.sqrt(
                 self.count_probability*(1.-self.count_probability)/\
                         grp.attrs['SSRO_repetitions'])
 
+    def __getattr__(self, name):
+        if name == 'counts' and 'count_data' in self.__dict__:
+            self.counts = self.count_data.read()
+            return self.counts
+        raise AttributeError(name)
+
 def awgssro(folder, ymax=1.):
     a = AWGSSROAnalysis(folder)
 
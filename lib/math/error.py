@@ -98,8 +98,106 @@ class Formula:
             uncertaintyfunc = lambdify((symbol, u_sym), u, 'numpy')
             return valfunc(values), uncertaintyfunc(values, uncertainties)       
 
+    def value_symbols(self):
+        return sorted(self.values.keys(), key=str)
+
+    def uncertainty_symbols(self):
+        return sorted(self.uncertainties.keys(), key=str)
+
+    def num_funcs(self, symbol):
+        """
+        numpy functions for the value and the uncertainty of the formula,
+        with the parameters as arguments instead of substituted:
+            value(x, values), uncertainty(x, u_x, values, uncertainties)
+        values and uncertainties are sequences in the order of 
+        value_symbols() and uncertainty_symbols(); the uncertainties are 
+        propagated like in num_eval (num_eval_correlation for matrix 
+        formulas, which give tuples of the elements).
+        the derivation is slow for large formulas, but has to be done only
+        once; the functions can then be used for any parameter values.
+        """
+        params = self.value_symbols()
+        uparams = self.uncertainty_symbols()
+        u_params = [ sympy.Dummy('u_%s' % s) for s in uparams ]
+
+        if isinstance(self.formula, sympy.MatrixBase):
+            elements = list(self.formula)
+            u_sym = sympy.DeferredVector('u_sym')
+            u_x = [ u_sym[j] for j in range(len(elements)) ]
+        else:
+            elements = [self.formula]
+            u_sym = sympy.Dummy('u_sym')
+            u_x = [ u_sym ]
+        
+        u = []
+        for e, _u_x in zip(elements, u_x):
+            usquared = (e.diff(symbol) * _u_x)**2
+            for s, u_s in zip(uparams, u_params):
+                usquared += (e.diff(s) * u_s)**2
+            u.append(sympy.sqrt(usquared))
+
+        if len(elements) == 1:
+            elements, u = elements[0], u[0]
+        else:
+            elements, u = tuple(elements), tuple(u)
+
+        valfunc = lambdify((symbol, params), elements, 'numpy')
+        uncertaintyfunc = lambdify((symbol, u_sym, params, u_params), u, 'numpy')
+        return valfunc, uncertaintyfunc
+
+    def num_eval_funcs(self, funcs, values, uncertainties=None):
+        """
+        evaluate functions obtained from num_funcs for the current
+        parameter values and uncertainties.
+        """
+        valfunc, uncertaintyfunc = funcs
+        params = [ self.values[s] for s in self.value_symbols() ]
+        u_params = [ self.uncertainties[s] for s in self.uncertainty_symbols() ]
+        if uncertainties is None:
+            uncertainties = np.zeros(np.shape(values))
+        
+        return valfunc(values, params), \
+                uncertaintyfunc(values, uncertainties, params, u_params)
+
+
+def correct_readout(E, dE, u_params, p):
+    """
+    numerical readout correction q = E^-1 p of the measured probabilities p 
+    (n x ...) with the error matrix E (n x n). dE are the derivatives of E 
+    w.r.t. the parameters with the uncertainties u_params.
+    returns q, the correction matrix E^-1, and the squared uncertainty of q
+    due to the parameters (dq/ds = -E^-1 dE/ds q).
+    """
+    C = np.linalg.inv(E)
+    q = np.tensordot(C, p, 1)
+    usquared = np.zeros(q.shape)
+    for d, u in zip(dE, u_params):
+        usquared += (u * np.tensordot(np.dot(C, d), q, 1))**2
+
+    return q, C, usquared
+
+def single_qubit_roc(p0, u_p0, F0, u_F0, F1, u_F1):
+    """
+    closed form of the single qubit readout correction (see SingleQubitROC):
+    returns p0 and its uncertainty, corrected for the readout fidelities
+    F0, F1. u_p0 may be None.
+    """
+    det = F0 + F1 - 1.
+    q = (np.asarray(p0, dtype=float) + F1 - 1.) / det
+    usquared = ((q*u_F0)**2 + ((1.-q)*u_F1)**2) / det**2
+    if u_p0 is not None:
+        usquared = usquared + (np.asarray(u_p0) / det)**2
+
+    return q, np.sqrt(usquared)
+
+
 class SingleQubitROC:
 
+    # the symbolic correction and its numpy functions are the same for all 
+    # instances; they are derived once and kept here.
+    _cache = {}
+
+
     def __init__(self):
         self.F0 = 1.
         self.F1 = 1.
@@ -107,23 +205,34 @@ class SingleQubitROC:
         self.u_F1 = 0.        
 
     def _setup(self):
-        self._F0, self._F1 = sympy.symbols('F0 F1')
-        self._p0 = sympy.symbols('p0')
+        c = SingleQubitROC._cache
+        if 'formula' not in c:
+            c['F0'], c['F1'] = sympy.symbols('F0 F1')
+            c['p0'] = sympy.symbols('p0')
 
-        self.error_matrix = sympy.Matrix(
-                [[self._F0, 1-self._F1],
-                    [1-self._F0, self._F1]])
+            c['error_matrix'] = sympy.Matrix(
+                    [[c['F0'], 1-c['F1']],
+                        [1-c['F0'], c['F1']]])
 
-        self.correction_matrix = self.error_matrix.inv()
+            c['correction_matrix'] = c['error_matrix'].inv()
         
-        corr_vec = self.correction_matrix * sympy.Matrix([self._p0, 1-self._p0])
-        corr_p0 = corr_vec[0]
+            corr_vec = c['correction_matrix'] * sympy.Matrix([c['p0'], 1-c['p0']])
+            c['formula'] = corr_vec[0]
+
+        self._F0, self._F1, self._p0 = c['F0'], c['F1'], c['p0']
+        self.error_matrix = c['error_matrix']
+        self.correction_matrix = c['correction_matrix']
 
         self.p0_formula = Formula()
-        self.p0_formula.formula = corr_p0
+        self.p0_formula.formula = c['formula']
     
     
-    def num_eval(self, p0, u_p0=None):
+    def num_eval(self, p0, u_p0=None, symbolic=False):
+        """
+        readout corrected p0 and its uncertainty. by default this uses the 
+        closed form (single_qubit_roc); with symbolic=True, the (cached) 
+        numpy functions of the symbolic formula are used instead.
+        """
         self._setup()
 
         self.p0_formula.values[self._F0] = self.F0
@@ -131,7 +240,14 @@ class SingleQubitROC:
         self.p0_formula.uncertainties[self._F0] = self.u_F0
         self.p0_formula.uncertainties[self._F1] = self.u_F1
         
-        return self.p0_formula.num_eval(self._p0, p0, u_p0)
+        if not symbolic:
+            return single_qubit_roc(p0, u_p0, self.F0, self.u_F0, 
+                    self.F1, self.u_F1)
+
+        c = SingleQubitROC._cache
+        if 'funcs' not in c:
+            c['funcs'] = self.p0_formula.num_funcs(self._p0)
+        return self.p0_formula.num_eval_funcs(c['funcs'], p0, u_p0)
 
 
 def simple_demo():
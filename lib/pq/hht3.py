@@ -54,6 +54,33 @@ import numpy as np
 #     _fulldat = np.hstack(tuple(fulldat)) if len(fulldat) > 0 else array([])
 #     return _fulldat
 
+# column layout of the decoded Nx4 event matrix; the record arrays
+# (T3_DTYPE, see decode_records) use the same order for their fields.
+SYNC, TIME, CHANNEL, SPECIAL = 0, 1, 2, 3
+T3_FIELDS = ('sync', 'time', 'channel', 'special')
+T3_DTYPE = np.dtype([('sync', np.uint64), ('time', np.uint16), 
+    ('channel', np.uint8), ('special', np.bool_)])
+
+# number of raw event words decoded at once by the streaming decoder
+CHUNKSIZE = 2**22
+
+def _col(data, col):
+    '''
+    returns column col (SYNC, TIME, CHANNEL, SPECIAL) of either an Nx4 event
+    matrix or a T3_DTYPE record array (as a view, can be modified in place).
+    '''
+    if data.dtype.names is not None:
+        return data[T3_FIELDS[col]]
+    return data[:,col]
+
+def _empty(data):
+    '''
+    empty event array of the same kind as data.
+    '''
+    if data.dtype.names is not None:
+        return np.zeros(0, dtype=data.dtype)
+    return np.zeros((0,4), dtype=np.uint)
+
 def data_from_file(filepath, do_filter_ofls=True, do_filter_crap=True, 
         ch0_lastbin=700, ch1_lastbin=700, **kw):
     
@@ -77,21 +104,59 @@ def data_from_file(filepath, do_filter_ofls=True, do_filter_crap=True,
         
     return data
 
-def _stitch_data(d1,d2):
-    l1 = len(d1[:,0])
-    l2 = len(d2[:,0])
+def records_from_file(filepath, do_filter_ofls=True, do_filter_crap=True, 
+        ch0_lastbin=700, ch1_lastbin=700, chunksize=CHUNKSIZE, **kw):
+    '''
+    like data_from_file, but returns a T3_DTYPE record array (12 bytes per
+    event instead of 32). the raw words are decoded chunk by chunk, 
+    time filtering is done per chunk.
+    '''
+    d = np.load(filepath)
+    raw = d['data']
+    d.close()
+
+    data = np.zeros(len(raw), dtype=T3_DTYPE)
+    n = 0
+    for chunk, ofls in decode_chunks(raw, chunksize=chunksize, 
+            do_filter_ofls=do_filter_ofls):
+        
+        if ch0_lastbin != None:
+            chunk = filter_timewindow(chunk, 0, 0, ch0_lastbin)
+
+        if ch1_lastbin != None:
+            chunk = filter_timewindow(chunk, 1, 0, ch1_lastbin)
+
+        data[n:n+len(chunk)] = chunk
+        n += len(chunk)
+    data = data[:n]
 
-    return np.vstack((d1,d2))
+    if do_filter_crap:
+        data = filter_decreasing_syncs(data)
+        
+    return data
+
+def _stitch_data(d1,d2):
+    return np.concatenate((d1,d2))
 
 def data_from_folder(path, sync_of=300, filecontains='alldata', *arg, **kw):
+    records = kw.pop('records', False)
     files = [ f for f in os.listdir(path) if f[:1] != '.' and filecontains in f and f[-4:] == '.npz' ]
 
-    fulldata = np.zeros((0,4), dtype=np.uint)
+    if records:
+        fulldata = np.zeros(0, dtype=T3_DTYPE)
+    else:
+        fulldata = np.zeros((0,4), dtype=np.uint)
+    
     ofl_of = 0
     for f in files:
-        data = data_from_file(os.path.join(path, f), *arg, **kw)
-        data[:,0] += ofl_of + sync_of
-        ofl_of = data[-1,0] + 1
+        if records:
+            data = records_from_file(os.path.join(path, f), *arg, **kw)
+        else:
+            data = data_from_file(os.path.join(path, f), *arg, **kw)
+        
+        syncs = _col(data, SYNC)
+        syncs += ofl_of + sync_of
+        ofl_of = int(syncs[-1]) + 1
         fulldata = _stitch_data(fulldata, data)
 
     return fulldata
@@ -103,32 +168,87 @@ def decode(data):
     special = np.bitwise_and(np.right_shift(data, 31), 1)
     return np.vstack((nsync, event_time, channel, special)).transpose()
 
+def decode_records(data):
+    '''
+    decode raw T3 words into a T3_DTYPE record array with the fields
+    sync (uint64), time (uint16), channel (uint8) and special (bool).
+    overflows are not corrected, see filter_overflows.
+    '''
+    records = np.zeros(len(data), dtype=T3_DTYPE)
+    records['sync'] = np.bitwise_and(data, 2**10-1)
+    records['time'] = np.bitwise_and(np.right_shift(data, 10), 2**15-1)
+    records['channel'] = np.bitwise_and(np.right_shift(data, 25), 2**6 - 1)
+    records['special'] = np.bitwise_and(np.right_shift(data, 31), 1)
+    return records
+
+def records_to_matrix(records):
+    '''
+    convert a T3_DTYPE record array to the Nx4 uint event matrix as returned
+    by decode (for code that still indexes by column).
+    '''
+    return np.vstack([records[f].astype(np.uint) for f in T3_FIELDS]).transpose()
+
+def decode_chunks(data, chunksize=CHUNKSIZE, ofl_offset=0, 
+        do_filter_ofls=True):
+    '''
+    generator that decodes raw T3 words (as in np.load(...)['data']) 
+    chunk by chunk into record arrays. overflows are counted across chunks,
+    such that the result is the same as for filter_overflows on the full
+    data; yields (records, ofl_offset), where ofl_offset is the offset
+    filter_overflows would return for the data up to the end of the chunk.
+    '''
+    noof_ofls = 0
+    ret_offset = ofl_offset
+    for i in range(0, len(data), chunksize):
+        records = decode_records(data[i:i+chunksize])
+        if do_filter_ofls:
+            ofl = records['channel'] == 63
+            shifts, noof_ofls = _ofl_shifts(ofl, ofl_offset, noof_ofls)
+            shifts *= 1024
+            records['sync'] += shifts
+            if noof_ofls > 0:
+                ret_offset = noof_ofls - 1 + ofl_offset
+            records = records[np.logical_not(ofl)]
+        yield records, ret_offset
+
+def _ofl_shifts(ofl, ofl_offset=0, noof_ofls=0, dtype=np.uint64):
+    '''
+    returns the sync offset (in units of 1024) to add to each event, given 
+    the boolean overflow mask ofl and the number of overflows noof_ofls
+    that came before; also returns the updated number of overflows.
+    the i-th overflow (counting from 0) sets the offset to i+ofl_offset
+    for all following events, events before the first one get ofl_offset.
+    '''
+    shifts = ofl.astype(dtype)
+    idx_ofl = np.flatnonzero(ofl)
+    if noof_ofls == 0 and len(idx_ofl) > 0:
+        shifts[idx_ofl[0]] = 0
+    np.cumsum(shifts, out=shifts)
+    shifts += max(noof_ofls-1, 0) + ofl_offset
+    return shifts, noof_ofls + len(idx_ofl)
+
 def filter_overflows(data, ofl_offset=0, print_status = False):
     t0 = time.time()
     
     if print_status:
         print '* filter overflows'
     
-    idx_ofl = np.where(data[:,2]==63)[0]
-    if len(idx_ofl) == 0:
-        data[:,0] += ofl_offset*1024
+    syncs = _col(data, SYNC)
+    ofl = _col(data, CHANNEL)==63
+    if not ofl.any():
+        syncs += ofl_offset*1024
         
         return data, ofl_offset
 
-    for i,idx in np.ndenumerate(idx_ofl):
-        if i[0] == 0:
-            data[:idx,0] += ofl_offset*1024
-        
-        if idx == idx_ofl[-1]:
-            data[idx:,0] += (i[0]+ofl_offset)*1024
-        else:
-            data[idx:idx_ofl[i[0]+1], 0] += (i[0]+ofl_offset)*1024
+    shifts, noof_ofls = _ofl_shifts(ofl, ofl_offset, dtype=syncs.dtype)
+    shifts *= 1024
+    syncs += shifts
     
     if print_status:
-        print '  found %d ofl events.' % len(idx_ofl)
+        print '  found %d ofl events.' % noof_ofls
         print '  processing took %.2f secs.' % (time.time()-t0)
     
-    return np.delete(data, idx_ofl, axis=0), i[0]+ofl_offset
+    return data[np.logical_not(ofl)], noof_ofls-1+ofl_offset
 
 def filter_timewindow(data, chan, mintime, maxtime, print_status = False):    
     t0 = time.time()
@@ -140,11 +260,11 @@ def filter_timewindow(data, chan, mintime, maxtime, print_status = False):
         print '  empty data, cannot time-filter'
         return data
 
-    notspecial = data[:,3] == 0
-    ch = data[:,2] == chan
+    notspecial = _col(data, SPECIAL) == 0
+    ch = _col(data, CHANNEL) == chan
     click = np.logical_and(notspecial, ch)
-    clickstartbad = np.logical_and(click, data[:,1] < mintime)
-    clickstopbad = np.logical_and(click, data[:,1] > maxtime)
+    clickstartbad = np.logical_and(click, _col(data, TIME) < mintime)
+    clickstopbad = np.logical_and(click, _col(data, TIME) > maxtime)
     clickbad = np.logical_or(clickstartbad, clickstopbad)
 
     # print clickbad.shape, click.shape
@@ -157,10 +277,70 @@ def filter_timewindow(data, chan, mintime, maxtime, print_status = False):
 
     filtered = np.logical_not(clickbad)
     if len(np.where(filtered)[0]) == 0:
-        return np.zeros((0,4), dtype=np.uint)
+        return _empty(data)
     
     return data[filtered]
 
+def _delta_runs(delta_syncs):
+    '''
+    split a list of sync deltas into runs of consecutive values, 
+    returned as list of (first, last).
+    '''
+    deltas = np.unique(np.asarray(delta_syncs, dtype=np.int64))
+    if len(deltas) == 0:
+        return []
+    
+    breaks = np.flatnonzero(np.diff(deltas) != 1) + 1
+    return [ (run[0], run[-1]) for run in np.split(deltas, breaks) ]
+
+def _has_partner(syncs, partners, delta_syncs):
+    '''
+    for each element of syncs, determine whether there is a partner sync
+    with partner - sync in delta_syncs. uses a binary search in the sorted
+    partner syncs, one pass per run of consecutive deltas.
+    '''
+    has = np.zeros(len(syncs), dtype=bool)
+    if len(syncs) == 0 or len(partners) == 0:
+        return has
+
+    syncs = syncs.astype(np.int64)
+    partners = partners.astype(np.int64)
+    if np.any(partners[1:] < partners[:-1]):
+        partners = np.sort(partners)
+
+    for first, last in _delta_runs(delta_syncs):
+        # the first partner at or after sync+first must not be later 
+        # than sync+last
+        idx = np.searchsorted(partners, syncs+first)
+        inside = idx < len(partners)
+        has[inside] |= partners[idx[inside]] <= syncs[inside]+last
+    
+    return has
+
+def counts_on_marker_masks(data, mchan, delta_syncs_list):
+    '''
+    like filter_counts_on_marker, but returns for each list of deltas in 
+    delta_syncs_list the boolean mask of the events to keep (all markers 
+    and the counts that pass the filter), instead of the filtered data.
+    '''
+    syncs = _col(data, SYNC)
+    special = _col(data, SPECIAL) == 1
+    mrkr = np.logical_and(special, _col(data, CHANNEL) == mchan)
+    clicks = np.logical_not(special)
+    click_syncs = syncs[clicks]
+    mrkr_syncs = syncs[mrkr]
+
+    masks = []
+    for delta_syncs in delta_syncs_list:
+        # delta = sync_count - sync_mrkr, i.e., mrkr - count = -delta
+        good = _has_partner(click_syncs, mrkr_syncs, 
+                [ -d for d in delta_syncs ])
+        mask = special.copy()
+        mask[clicks] = good
+        masks.append(mask)
+
+    return masks
+
 def filter_counts_on_marker(data, mchan, delta_syncs=[1,2], print_status=False):
     '''
     filter on counts that have a marker on mchan and whose sync
@@ -171,49 +351,32 @@ def filter_counts_on_marker(data, mchan, delta_syncs=[1,2], print_status=False):
     if print_status:
         print '* filter counts on mrkr %d' % mchan
    
-    special = data[:,3] == 1
-    mrkr = np.logical_and(special, data[:,2] == mchan)
-    mrkr_idx = np.where(mrkr)[0]
-    clicks = np.logical_not(special)
-    
-    # good = data[clicks,0] < 0 # gives an array with right size, all false
-    noof_mrkrs = len(data[mrkr,0])
-    noof_deltas = len(delta_syncs)
-
-    goodsyncs = np.zeros(noof_mrkrs*noof_deltas, dtype=int) - 1
-    for i,d in enumerate(delta_syncs):
-        goodsyncs[i*noof_mrkrs:(i+1)*noof_mrkrs] = data[mrkr,0]+d
-    
-    good = np.in1d(data[clicks,0], goodsyncs)
-  
-    # should be small, can iterate
-    for i,idx in np.ndenumerate(np.where(clicks)[0]):
-        if not good[i]:
-            clicks[idx] = False
+    filtered = counts_on_marker_masks(data, mchan, [delta_syncs])[0]
     
     if print_status:
-        print '  %d of %d clicks are valid.' % (len(data[clicks]), 
-             len(data[np.logical_not(special)]))
+        special = _col(data, SPECIAL) == 1
+        print '  %d of %d clicks are valid.' % (
+            len(np.where(np.logical_and(filtered, np.logical_not(special)))[0]), 
+            len(data[np.logical_not(special)]))
         print '  processing took %.2f secs.' % (time.time()-t0)
 
-    filtered = np.logical_or(special, clicks)
     if len(np.where(filtered)[0]) == 0:
-        return np.zeros((0,4), dtype=np.uint)
+        return _empty(data)
 
     return data[filtered]
 
 def filter_decreasing_syncs(data):
     
     print '* filter on decreasing sync numbers at the beginning'
-    i = 0
-    minsync = np.argmin(data[:,0])
-    data = data[minsync:,]
+    minsync = np.argmin(_col(data, SYNC))
+    data = data[minsync:]
 
-    while not all([x<=y for x,y in zip(data[:,0],data[1:,0])]):
-        data = data[1:,:]
-        i += 1
-        if len(data) == 0:
-            break
+    # keep everything after the last decrease, from there on the syncs
+    # are non-decreasing
+    syncs = _col(data, SYNC)
+    decreasing = np.flatnonzero(syncs[1:] < syncs[:-1])
+    i = decreasing[-1] + 1 if len(decreasing) > 0 else 0
+    data = data[i:]
 
     print '  first %d events were invalid, %d remain' % (i, len(data))
     return data
@@ -223,18 +386,13 @@ def filter_marker_on_counts(data, mchan, delta_syncs=[0], print_status = False):
     if print_status:
         print '* filter mrkr %s on counts' % mchan
 
-    special = data[:,3] == 1
-    mrkr = np.logical_and(special, data[:,2] == mchan)
+    syncs = _col(data, SYNC)
+    special = _col(data, SPECIAL) == 1
+    mrkr = np.logical_and(special, _col(data, CHANNEL) == mchan)
     other_mrkr = np.logical_and(special, np.logical_not(mrkr))
     clicks = np.logical_not(special)
 
-    good = data[mrkr,0] < 0
-    for d in delta_syncs:
-        good = np.logical_or(good, np.in1d(data[mrkr,0]+d, data[clicks,0]))
-
-    for i,idx in np.ndenumerate(np.where(mrkr)[0]):
-        if not good[i]:
-            mrkr[idx] = False
+    mrkr[mrkr] = _has_partner(syncs[mrkr], syncs[clicks], delta_syncs)
     
     if print_status:
         print '  %d markers are valid.' % len(data[mrkr])
@@ -242,7 +400,7 @@ def filter_marker_on_counts(data, mchan, delta_syncs=[0], print_status = False):
 
     filtered = np.logical_or(np.logical_or(other_mrkr, mrkr), clicks)
     if len(np.where(filtered)[0]) == 0:
-        return np.zeros((0,4), dtype=np.uint)
+        return _empty(data)
     
     return data[filtered]
 
@@ -251,17 +409,17 @@ def filter_early_high_syncs(data):
     quickfix no1 (august 3, 2012): start at the smalles sync no, discard
     all data before.
     '''
-    minidx = np.argmin(data[:,0])
-    return data[minidx:,:]
+    minidx = np.argmin(_col(data, SYNC))
+    return data[minidx:]
 
 
 def delete_markers(data, mchan):
-    special = data[:,3] == 1
-    mrkr = np.logical_and(special, data[:,2] == mchan)
+    special = _col(data, SPECIAL) == 1
+    mrkr = np.logical_and(special, _col(data, CHANNEL) == mchan)
 
     filtered = np.logical_not(mrkr)
     if len(np.where(filtered)[0]) == 0:
-        return np.zeros((0,4), dtype=np.uint)
+        return _empty(data)
 
     return data[filtered]
 
@@ -288,14 +446,19 @@ def save_data(d, filepath='hhdata'):
     return True
 
 def get_click_times(data):    
-    special = data[:,3] == 1
+    special = _col(data, SPECIAL) == 1
     allclicks = data[np.logical_not(special)]
-    t0 = allclicks[allclicks[:,2]==0,1]
-    t1 = allclicks[allclicks[:,2]==1,1]
+    t0 = _col(allclicks, TIME)[_col(allclicks, CHANNEL)==0]
+    t1 = _col(allclicks, TIME)[_col(allclicks, CHANNEL)==1]
 
     return t0,t1
 
 def get_clicks(data):
+    if data.dtype.names is not None:
+        allclicks = data[_col(data, SPECIAL) == 0]
+        return allclicks[_col(allclicks, CHANNEL)==0], \
+                allclicks[_col(allclicks, CHANNEL)==1]
+
     if len(data) == 0:
         return np.zeros((4,0), dtype=np.uint), np.zeros((4,0), dtype=np.uint)
 
@@ -309,17 +472,18 @@ def get_clicks(data):
     return t0,t1
 
 def get_allclicks(data):
-    c = data[:,3] == 0
+    c = _col(data, SPECIAL) == 0
+    if data.dtype.names is not None:
+        return data[c]
+
     allclicks = data[c] if len(np.where(c)[0]) > 0 else np.zeros((4,0), dtype=np.uint)    
     return allclicks 
 
 def get_markers(data, mchan=1):
-    special = data[:,3] == 1
-    mrkrs = np.logical_and(special, data[:,2]==mchan)
+    special = _col(data, SPECIAL) == 1
+    mrkrs = np.logical_and(special, _col(data, CHANNEL)==mchan)
 
     if len(np.where(mrkrs)[0]) > 0:
-        return data[mrkrs,:]
+        return data[mrkrs]
     else:
-        return np.zeros((0,4), dtype=np.uint)
-
-
+        return _empty(data)
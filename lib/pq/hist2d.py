@@ -0,0 +1,117 @@
+"""
+2D histograms of HH photon events vs sync time and a sweep parameter that is
+stepped by markers (generalizes the Cython hist2d in 
+scripts/teleportation/T2_filter_files).
+
+the numpy version works everywhere; if the compiled kernel in hist2d_files
+has been built (python setup.py build_ext --inplace in that folder), it is
+used by default.
+"""
+
+import numpy as np
+
+try:
+    from analysis.lib.pq.hist2d_files import hist2d_c
+except ImportError:
+    hist2d_c = None
+
+CHUNKSIZE = 2**22
+
+def _hist2d_numpy(channel, special, sync_time, hist, channels, binedges, 
+        period, pts, marker_channel, marker_count):
+    nbins = len(binedges) - 1
+    widths = binedges[1:] - binedges[:-1]
+    uniform = widths[0] > 0 and np.all(widths == widths[0])
+    
+    is_mrkr = (special == 1) & (channel == marker_channel)
+    mrkrs = marker_count + np.cumsum(is_mrkr)
+    
+    c = np.zeros(len(channel), dtype=np.int64) - 1
+    for i in range(len(channels)-1, -1, -1):
+        c[channel == channels[i]] = i
+    is_ph = np.flatnonzero((special == 0) & (c >= 0))
+    t = sync_time[is_ph]
+    
+    # O(1) bin arithmetic for uniform bins, binary search otherwise
+    if uniform:
+        valid = (t >= binedges[0]) & (t < binedges[-1])
+        b = (t[valid] - binedges[0]) // widths[0]
+    else:
+        b = np.searchsorted(binedges, t, side='right') - 1
+        valid = (b >= 0) & (b < nbins)
+        b = b[valid]
+    
+    is_ph = is_ph[valid]
+    pt = (mrkrs[is_ph] // period) % pts
+    idx = (c[is_ph] * pts + pt) * nbins + b.astype(np.int64)
+    hist += np.bincount(idx, minlength=hist.size).reshape(
+            hist.shape).astype(hist.dtype)
+    
+    return marker_count + int(np.sum(is_mrkr))
+
+def hist2d(channel, special, sync_time, period, pts, t_start, t_stop, t_bins,
+        hist_channel=0, **kw):
+    """
+    Get a 2D histogram of photon counts, with axes sync time and some second 
+    parameter. We assume here that we get <period> markers in row for the 
+    same sweep parameter, and cycle through <pts> points of that parameter.
+    The photon events are binned according to <t_start>, <t_stop>, and 
+    <t_bins> (bins [edge_i, edge_i+1)), where we only look at the photons on
+    channel <hist_channel>.
+
+    channel, special and sync_time can be arrays or HDF5 datasets; they are
+    processed in chunks.
+
+    hist_channel may also be a list of channels; the histogram then has an 
+    additional first axis (one histogram per channel).
+    
+    known keywords:
+    - marker_channel (=1): the channel of the markers that step the sweep
+    - binedges: use these (possibly non-uniform) bin edges instead of
+      t_start, t_stop, t_bins.
+    - compiled (=None): use the compiled kernel; by default if available.
+    - chunksize (=CHUNKSIZE)
+
+    The function returns the <pts> x <t_bins> histogram, and the values of 
+    the bin edges.
+    """
+    marker_channel = kw.pop('marker_channel', 1)
+    binedges = kw.pop('binedges', None)
+    compiled = kw.pop('compiled', None)
+    chunksize = kw.pop('chunksize', CHUNKSIZE)
+
+    if binedges is None:
+        binedges = np.linspace(t_start, t_stop, t_bins+1).astype('u8')
+    binedges = np.asarray(binedges, dtype='u8')
+    
+    if compiled == None:
+        compiled = hist2d_c != None
+    elif compiled and hist2d_c == None:
+        raise Exception('The compiled hist2d kernel is not available.')
+    
+    channels = np.atleast_1d(hist_channel)
+    hist = np.zeros((len(channels), pts, len(binedges)-1), dtype='u4')
+    if compiled:
+        chan_idx = np.zeros(256, dtype=np.int64) - 1
+        chan_idx[channels[::-1]] = np.arange(len(channels))[::-1]
+
+    marker_count = 0
+    for start in range(0, len(channel), chunksize):
+        ch = np.asarray(channel[start:start+chunksize])
+        sp = np.asarray(special[start:start+chunksize])
+        st = np.asarray(sync_time[start:start+chunksize])
+        
+        if compiled:
+            marker_count = hist2d_c.hist2d(
+                np.ascontiguousarray(ch, dtype=np.uint8),
+                np.ascontiguousarray(sp, dtype=np.uint8),
+                np.ascontiguousarray(st, dtype=np.uint64),
+                hist, chan_idx, binedges, period, pts, marker_channel, 
+                marker_count)
+        else:
+            marker_count = _hist2d_numpy(ch, sp, st, hist, channels, binedges,
+                period, pts, marker_channel, marker_count)
+    
+    if np.ndim(hist_channel) == 0:
+        hist = hist[0]
+    return hist, binedges
@@ -0,0 +1,78 @@
+"""
+Cython-based kernel for analysis.lib.pq.hist2d (see there).
+build in place with 'python setup.py build_ext --inplace'.
+"""
+
+import numpy as np
+cimport numpy as cnp
+cimport cython
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def hist2d(cnp.uint8_t[::1] channel,
+    cnp.uint8_t[::1] special,
+    cnp.uint64_t[::1] sync_time,
+    cnp.uint32_t[:,:,::1] hist,
+    cnp.int64_t[::1] chan_idx,
+    cnp.uint64_t[::1] binedges,
+    long period,
+    long pts,
+    int marker_channel,
+    long marker_count):
+
+    """
+    adds the photons to hist (channels x pts x bins); chan_idx (length 256)
+    gives the first index of hist for each channel (-1: not histogrammed).
+    returns the number of markers seen, including marker_count from
+    previous calls.
+    """
+
+    cdef Py_ssize_t i, lo, hi, mid
+    cdef Py_ssize_t length = channel.shape[0]
+    cdef Py_ssize_t nbins = binedges.shape[0] - 1
+    cdef cnp.int64_t c
+    cdef cnp.uint64_t t
+    cdef cnp.uint64_t t0 = binedges[0]
+    cdef cnp.uint64_t t1 = binedges[nbins]
+    cdef cnp.uint64_t width = binedges[1] - binedges[0]
+    cdef long pt = (marker_count / period) % pts
+    cdef bint uniform = width > 0
+
+    for i in range(nbins):
+        if binedges[i+1] - binedges[i] != width:
+            uniform = False
+            break
+
+    for i in range(length):
+        if special[i] == 1:
+            if channel[i] == marker_channel:
+                marker_count += 1
+                if marker_count % period == 0:
+                    pt = (marker_count / period) % pts
+            continue
+
+        if special[i] != 0:
+            continue
+
+        c = chan_idx[channel[i]]
+        t = sync_time[i]
+        if c < 0 or t < t0 or t >= t1:
+            continue
+
+        # find the correct bin
+        if uniform:
+            lo = (t - t0) / width
+        else:
+            lo = 0
+            hi = nbins
+            while lo < hi:
+                mid = (lo + hi) / 2
+                if binedges[mid+1] > t:
+                    hi = mid
+                else:
+                    lo = mid + 1
+
+        hist[c, pt, lo] += 1
+
+    return marker_count
@@ -1,11 +1,18 @@
+import numpy as np
 import sympy
 from sympy.utilities.lambdify import implemented_function, lambdify
 from sympy import DeferredVector
 from sympy.physics.quantum import TensorProduct
 from analysis.lib.math import error
+from analysis.lib.spin import Nspin_correction
 reload(error)
 
 class CorrelationsROC:
+
+    # the symbolic 4x4 correction takes seconds to derive; done only once
+    # (see _setup)
+    _cache = {}
+
     def __init__(self):
         self.F0_e_ssro = 1.
         self.u_F0_e_ssro = 0.
@@ -29,6 +36,18 @@ class CorrelationsROC:
         self.u_F1_RO_pulse = 0.01
     
     def _setup(self):
+        c = CorrelationsROC._cache
+        if 'formula' in c:
+            (self._F0_N_ssro, self._F1_N_ssro, self._F0_e_ssro, self._F1_e_ssro, 
+                self._F0_RO_pulse, self._F1_RO_pulse, self._P_min1, self._P_0, 
+                self._p_correlations) = c['symbols']
+            self.error_matrix_N = c['error_matrix_N']
+            self.error_matrix_e = c['error_matrix_e']
+            self.correction_matrix = c['correction_matrix']
+            self.p0_formula = error.Formula()
+            self.p0_formula.formula = c['formula']
+            return
+
         self._F0_N_ssro, self._F1_N_ssro, self._F0_e_ssro, self._F1_e_ssro, self._F0_RO_pulse, self._F1_RO_pulse, self._P_min1, self._P_0 = \
             sympy.symbols('F0_N_ssro F1_N_ssro F0_e_ssro F1_e_ssro F0_RO_pulse F1_RO_pulse P_min1 P_0')
         self._p_correlations = sympy.DeferredVector('p_correlations')
@@ -56,8 +75,28 @@ class CorrelationsROC:
                 
         self.p0_formula = error.Formula()
         self.p0_formula.formula = corr_p_correlations
+
+        c['symbols'] = (self._F0_N_ssro, self._F1_N_ssro, self._F0_e_ssro, 
+                self._F1_e_ssro, self._F0_RO_pulse, self._F1_RO_pulse, 
+                self._P_min1, self._P_0, self._p_correlations)
+        c['error_matrix_N'] = self.error_matrix_N
+        c['error_matrix_e'] = self.error_matrix_e
+        c['correction_matrix'] = self.correction_matrix
+        c['formula'] = corr_p_correlations
                       
-    def num_evaluation(self, p_correlations, u_p_correlations=None):
+    def num_evaluation(self, p_correlations, u_p_correlations=None, 
+            symbolic=False):
+        """
+        readout corrected correlations (shape (4, pts)) and their 
+        uncertainties, from the measured ones (shape (pts, 4)).
+        by default evaluated numerically: the error matrix is the tensor 
+        product of the nitrogen (Nspin_correction.nitrogen_error_matrix) 
+        and electron error matrices.
+        with symbolic=True the (cached) numpy functions of the symbolic 
+        formula are used. note that neither propagates u_p_correlations 
+        (in the symbolic formula the derivative w.r.t. the DeferredVector 
+        vanishes; the numerical evaluation gives the same result).
+        """
         self._setup()
         
         #Here all values and uncertainties of the fidelities are listed.
@@ -81,5 +120,30 @@ class CorrelationsROC:
         self.p0_formula.values[self._P_0] = self.P_0
         self.p0_formula.uncertainties[self._P_0] = self.u_P_0
 
-        return self.p0_formula.num_eval_correlation(self._p_correlations, p_correlations.T , u_p_correlations.T)
+        if symbolic:
+            c = CorrelationsROC._cache
+            if 'funcs' not in c:
+                c['funcs'] = self.p0_formula.num_funcs(self._p_correlations)
+            u = u_p_correlations.T if u_p_correlations is not None else None
+            return self.p0_formula.num_eval_funcs(c['funcs'], 
+                    p_correlations.T, u)
+
+        E_N, dE_N = Nspin_correction.nitrogen_error_matrix(
+                self.F0_N_ssro, self.F1_N_ssro, self.F0_RO_pulse, 
+                self.F1_RO_pulse, self.P_min1, self.P_0)
+        E_e = np.array([[self.F0_e_ssro, 1.-self.F1_e_ssro],
+            [1.-self.F0_e_ssro, self.F1_e_ssro]])
+        dE_e = [ np.array([[1.,0.],[-1.,0.]]), np.array([[0.,-1.],[0.,1.]]) ]
+
+        E = np.kron(E_N, E_e)
+        dE = [ np.kron(d, E_e) for d in dE_N ] + \
+                [ np.kron(E_N, d) for d in dE_e ]
+        u_params = [self.u_F0_N_ssro, self.u_F1_N_ssro, self.u_F0_RO_pulse,
+                self.u_F1_RO_pulse, self.u_P_min1, self.u_P_0,
+                self.u_F0_e_ssro, self.u_F1_e_ssro]
+
+        q, C, usquared = error.correct_readout(E, dE, u_params, 
+                np.asarray(p_correlations, dtype=float).T)
+
+        return q, np.sqrt(usquared)
     
@@ -1,8 +1,39 @@
+import numpy as np
 import sympy
 from sympy.utilities.lambdify import implemented_function, lambdify
 from analysis.lib.math import error
 
+def nitrogen_error_matrix(F0_ssro, F1_ssro, F0_RO_pulse, F1_RO_pulse, 
+        P_min1, P_0):
+    """
+    numerical version of the error matrix of NuclearSpinROC (see there).
+    returns the matrix and its derivatives w.r.t. the arguments 
+    (in the same order).
+    """
+    RO_err = np.array([[F0_ssro, 1.-F1_ssro], [1.-F0_ssro, F1_ssro]])
+    CNOT_err = np.array([[F0_RO_pulse, 1.-F1_RO_pulse, 0.], 
+        [1.-F0_RO_pulse, F1_RO_pulse, 1.]])
+    Init_err = np.array([[P_min1, P_0], [P_0, P_min1], 
+        [1.-P_0-P_min1, 1.-P_0-P_min1]])
+    
+    dRO = [ np.array([[1.,0.],[-1.,0.]]), np.array([[0.,-1.],[0.,1.]]) ]
+    dCNOT = [ np.array([[1.,0.,0.],[-1.,0.,0.]]), 
+            np.array([[0.,-1.,0.],[0.,1.,0.]]) ]
+    dInit = [ np.array([[1.,0.],[0.,1.],[-1.,-1.]]), 
+            np.array([[0.,1.],[1.,0.],[-1.,-1.]]) ]
+
+    E = np.dot(np.dot(RO_err, CNOT_err), Init_err)
+    dE = [ np.dot(np.dot(d, CNOT_err), Init_err) for d in dRO ] + \
+            [ np.dot(np.dot(RO_err, d), Init_err) for d in dCNOT ] + \
+            [ np.dot(np.dot(RO_err, CNOT_err), d) for d in dInit ]
+    
+    return E, dE
+
 class NuclearSpinROC:
+
+    # symbolic correction, derived only once (see _setup)
+    _cache = {}
+
     def __init__(self):
         self.F0_ssro = 1.
         self.u_F0_ssro = 0.
@@ -21,6 +52,16 @@ class NuclearSpinROC:
         self.u_F1_RO_pulse = 0.01
     
     def _setup(self):
+        c = NuclearSpinROC._cache
+        if 'formula' in c:
+            (self._F0_ssro, self._F1_ssro, self._F0_RO_pulse, self._F1_RO_pulse, 
+                self._P_min1, self._P_0, self._p0) = c['symbols']
+            self.error_matrix = c['error_matrix']
+            self.correction_matrix = c['correction_matrix']
+            self.p0_formula = error.Formula()
+            self.p0_formula.formula = c['formula']
+            return
+
         self._F0_ssro, self._F1_ssro, self._F0_RO_pulse, self._F1_RO_pulse, self._P_min1, self._P_0 = \
            sympy.symbols('F0_ssro F1_ssro F0_RO_pulse F1_RO_pulse P_min1 P_0')
         self._p0 = sympy.symbols('p0')
@@ -46,8 +87,19 @@ class NuclearSpinROC:
         
         self.p0_formula = error.Formula()
         self.p0_formula.formula = corr_p0
+
+        c['symbols'] = (self._F0_ssro, self._F1_ssro, self._F0_RO_pulse, 
+                self._F1_RO_pulse, self._P_min1, self._P_0, self._p0)
+        c['error_matrix'] = self.error_matrix
+        c['correction_matrix'] = self.correction_matrix
+        c['formula'] = corr_p0
                       
-    def num_evaluation(self, p0, u_p0=None):
+    def num_evaluation(self, p0, u_p0=None, symbolic=False):
+        """
+        readout corrected p0 and its uncertainty. by default evaluated 
+        numerically (nitrogen_error_matrix); with symbolic=True, the (cached)
+        numpy functions of the symbolic formula are used instead.
+        """
         self._setup()
         
         self.p0_formula.values[self._F0_ssro] = self.F0_ssro
@@ -64,9 +116,23 @@ class NuclearSpinROC:
         self.p0_formula.uncertainties[self._P_min1] = self.u_P_min1
         self.p0_formula.values[self._P_0] = self.P_0
         self.p0_formula.uncertainties[self._P_0] = self.u_P_0
-                
-        self.p0_formula.num_eval(self._p0, p0, u_p0)
+        
+        if symbolic:
+            c = NuclearSpinROC._cache
+            if 'funcs' not in c:
+                c['funcs'] = self.p0_formula.num_funcs(self._p0)
+            return self.p0_formula.num_eval_funcs(c['funcs'], p0, u_p0)
 
-        return self.p0_formula.num_eval(self._p0, p0, u_p0)
+        E, dE = nitrogen_error_matrix(self.F0_ssro, self.F1_ssro, 
+                self.F0_RO_pulse, self.F1_RO_pulse, self.P_min1, self.P_0)
+        u_params = [self.u_F0_ssro, self.u_F1_ssro, self.u_F0_RO_pulse, 
+                self.u_F1_RO_pulse, self.u_P_min1, self.u_P_0]
+        
+        p = np.array([p0, 1.-np.asarray(p0, dtype=float)])
+        q, C, usquared = error.correct_readout(E, dE, u_params, p)
+        if u_p0 is not None:
+            usquared[0] += ((C[0,0]-C[0,1]) * np.asarray(u_p0))**2
+        
+        return q[0], np.sqrt(usquared[0])
     
     
\ No newline at end of file
@@ -1,3 +1,4 @@
+import os
 import numpy as np
 import h5py
 
@@ -27,38 +28,136 @@ T_EV_COL_CR2_AFTER = 13
 T_EV_COL_PLU_ABS_TIME = 14
 
 
-### identification of events
-def get_photons(fp):
+### access to the HH data
+class HHEventTable(object):
     """
-    returns two filters (1d-arrays): whether events are ch0-photons/ch1-photons
+    the HydraHarp event data of a measurement file. the file is opened once
+    (on first access), and each dataset is read once, when it is first 
+    needed; the derived photon and marker filters are kept as well.
+    
+    close() releases the file; data that has been read stays available.
     """
-    f = h5py.File(fp, 'r')
-    channel = f['/HH_channel-1'].value
-    special = f['/HH_special-1'].value
-    f.close()
 
-    is_not_special = special==0
-    is_channel_0 = channel==0
-    is_channel_1 = channel==1
+    def __init__(self, fp):
+        self.fp = fp
+        self.f = None
+        self._data = {}
+        self._filters = {}
+
+    def open(self):
+        if self.f is None:
+            self.f = h5py.File(self.fp, 'r')
+        return self.f
+
+    def close(self):
+        if self.f is not None:
+            self.f.close()
+            self.f = None
+
+    def __getitem__(self, name):
+        if name not in self._data:
+            self._data[name] = self.open()[name].value
+        return self._data[name]
+
+    def iter_chunks(self, names, chunksize=None):
+        """
+        iterate over the datasets names in slices of chunksize events; 
+        yields the start index and the list of slices. datasets that have 
+        been read already are not read again, the others are only read 
+        slice by slice.
+        """
+        if chunksize == None:
+            chunksize = settings.HH_CHUNKSIZE
+        
+        dsets = [ self._data[n] if n in self._data else self.open()[n] 
+            for n in names ]
+        for start in range(0, len(dsets[0]), chunksize):
+            yield start, [ d[start:start+chunksize] for d in dsets ]
+
+    @property
+    def sync_numbers(self):
+        return self['/HH_sync_number-1']
+
+    @property
+    def sync_times(self):
+        return self['/HH_sync_time-1']
+
+    @property
+    def channels(self):
+        return self['/HH_channel-1']
+
+    @property
+    def special(self):
+        return self['/HH_special-1']
+
+    @property
+    def abs_times(self):
+        return self['/HH_time-1']
+
+    @property
+    def photons(self):
+        """
+        two filters (1d-arrays): whether events are ch0-photons/ch1-photons
+        """
+        if 'photons' not in self._filters:
+            is_not_special = self.special==0
+            self._filters['photons'] = (
+                np.logical_and(is_not_special, self.channels==0),
+                np.logical_and(is_not_special, self.channels==1) )
+        return self._filters['photons']
+
+    def markers(self, chan):
+        """
+        a filter (1d-array): whether events are markers on the given channel
+        """
+        key = ('markers', chan)
+        if key not in self._filters:
+            self._filters[key] = (self.special==1) & (self.channels==chan)
+        return self._filters[key]
+
+    def marker_filter(self, chan):
+        """
+        a filter (1d-array): whether events have the same sync number as a
+        marker on the given channel (includes the markers themselves).
+        """
+        key = ('marker_filter', chan)
+        if key not in self._filters:
+            self._filters[key] = filter_on_same_sync_number(
+                self.sync_numbers[self.markers(chan)], self.sync_numbers)
+        return self._filters[key]
+
+def _hhtable(fp, hh):
+    """
+    returns the HHEventTable to use (hh, or a new one for fp), and whether
+    it needs to be closed after use.
+    """
+    if hh is None:
+        return HHEventTable(fp), True
+    return hh, False
+
 
-    is_photon_0 = np.logical_and(is_not_special, is_channel_0)
-    is_photon_1 = np.logical_and(is_not_special, is_channel_1)
+### identification of events
+def get_photons(fp, hh=None):
+    """
+    returns two filters (1d-arrays): whether events are ch0-photons/ch1-photons
+    """
+    hh, close = _hhtable(fp, hh)
+    is_photon_0, is_photon_1 = hh.photons
+    if close:
+        hh.close()
 
     return is_photon_0, is_photon_1
 
-def get_markers(fp, chan):
+def get_markers(fp, chan, hh=None):
     """
     returns a filter (1d-array): whether events are markers on the given channel
     """
-    f = h5py.File(fp, 'r')
-    channel = f['/HH_channel-1'].value
-    special = f['/HH_special-1'].value
-    f.close()
-    
-    is_special = special==1
-    is_channel = channel==chan
+    hh, close = _hhtable(fp, hh)
+    is_mrkr = hh.markers(chan)
+    if close:
+        hh.close()
     
-    return (is_special & is_channel)
+    return is_mrkr
 
 def get_coincidences(fp):
     f = h5py.File(fp, 'r')
@@ -79,43 +178,64 @@ def get_coincidences(fp):
 
 
 ### photon histograms
+def _photon_hist(sync_time, binedges):
+    """
+    histogram (as np.histogram) of sync times (in ps) with binedges in ns. 
+    for uniform bins with integer ps edges, the times are binned directly 
+    with integer arithmetic.
+    """
+    edges_ps = np.round(binedges*1e3)
+    widths = edges_ps[1:] - edges_ps[:-1]
+    if not (np.allclose(edges_ps, binedges*1e3, rtol=0, atol=1e-3) and \
+            widths[0] > 0 and np.all(widths == widths[0])):
+        return np.histogram(sync_time*1e-3, bins=binedges)[0]
+
+    t = sync_time.astype(np.int64)
+    b = (t - int(edges_ps[0])) // int(widths[0])
+
+    # like np.histogram, the last bin includes its right edge
+    b[t == int(edges_ps[-1])] = len(widths) - 1
+    b = b[(b >= 0) & (b < len(widths))]
+    return np.bincount(b, minlength=len(widths))
+
 def get_photon_hist(fp, **kw):
     save = kw.pop('save', False)
     fltr = kw.pop('fltr', None)
     force_eval = kw.pop('force_eval', True)
     binedges = kw.pop('binedges', settings.PHOTONHIST_BINEDGES)
+    hh, close = _hhtable(fp, kw.pop('hh', None))
+    key = files.get_analysis_key(fp, binedges=binedges, fltr=fltr)
     
-    if not force_eval and files.has_analysis_data(fp, 'photon_histogram'):
+    if not force_eval and files.has_analysis_data(fp, 'photon_histogram', key=key):
         h, h_attrs = files.get_analysis_data(fp, 'photon_histogram')
         be, be_attrs = files.get_analysis_data(fp, 'photon_histogram_binedges_ns')
         h0 = h[:,0]
         h1 = h[:,1]
         return (h0, be), (h1, be)
     
-    f = h5py.File(fp, 'r')
-    sync_time_ns = f['/HH_sync_time-1'].value * 1e-3
-    f.close()
-    
-    ph0, ph1 = get_photons(fp)
-    if fltr != None:
-        _fltr0 = (ph0 & fltr)
-        _fltr1 = (ph1 & fltr)
-    else:
-        _fltr0 = ph0
-        _fltr1 = ph1
-    
-    st0 = sync_time_ns[_fltr0]
-    st1 = sync_time_ns[_fltr1]
-    
-    h0, b0 = np.histogram(st0, bins=binedges)
-    h1, b1 = np.histogram(st1, bins=binedges)
+    # the HH data is read in chunks, and only the histograms are kept
+    binedges = np.asarray(binedges, dtype=float)
+    h0 = np.zeros(len(binedges)-1, dtype=np.int64)
+    h1 = np.zeros(len(binedges)-1, dtype=np.int64)
+    for start, (sync_time, channel, special) in hh.iter_chunks(
+            ['/HH_sync_time-1', '/HH_channel-1', '/HH_special-1']):
+        is_not_special = special==0
+        if fltr is not None:
+            is_not_special &= fltr[start:start+len(special)]
+        
+        h0 += _photon_hist(sync_time[is_not_special & (channel==0)], binedges)
+        h1 += _photon_hist(sync_time[is_not_special & (channel==1)], binedges)
+
+    if close:
+        hh.close()
+    b0 = b1 = binedges
     
     if save:
-        files.set_analysis_data(fp, 'photon_histogram', vstack((h0,h1)).transpose(),
-                          columns=('channel_0', 'channel_1'))
+        files.set_analysis_data(fp, 'photon_histogram', np.vstack((h0,h1)).transpose(),
+                          key=key, columns=('channel_0', 'channel_1'))
         files.set_analysis_data(fp, 'photon_histogram_binedges_ns', b0)
         files.delete_analysis_data(fp, 'photon_histogram_event_filter')
-        if fltr != None:
+        if fltr is not None:
             files.set_analysis_data(fp, 'photon_histogram_event_filter', fltr)
         
     return (h0, b0), (h1, b1)
@@ -126,12 +246,12 @@ def get_photon_hists_from_folder(folder, **kw):
     return the cumulative photon histogram from all data contained in a folder
     (all sub-levels are searched).
     '''
-    filepaths = files.get_all_msmt_filepaths(folder)
-    for i,f in enumerate(filepaths):
+    processes = kw.pop('processes', None)
+    hists = files.map_msmt_files(get_photon_hist, folder, processes, **kw)
+    for i,((_h0,_b0),(_h1,_b1)) in enumerate(hists):
         if i == 0:
-            (h0,b0),(h1,b1) = get_photon_hist(f, **kw)
+            (h0,b0),(h1,b1) = (_h0,_b0),(_h1,_b1)
         else:
-            (_h0,_b0),(_h1,_b1) = get_photon_hist(f, **kw)
             h0 += _h0
             h1 += _h1
     return (h0, b0), (h1, b1)
@@ -155,19 +275,16 @@ def filter_on_same_sync_number(source_sync_numbers, target_sync_numbers):
     """
     return np.in1d(target_sync_numbers, source_sync_numbers)
 
-def filter_marker(fp, chan):
+def filter_marker(fp, chan, hh=None):
     """
     Note: at the moment this filter includes the marker events on which we filter.
     """
-    is_mrkr = get_markers(fp, chan)
-        
-    f = h5py.File(fp, 'r')
-    sync_numbers = f['/HH_sync_number-1'].value
-    f.close()
+    hh, close = _hhtable(fp, hh)
+    fltr = hh.marker_filter(chan)
+    if close:
+        hh.close()
     
-    marker_sync_numbers = sync_numbers[is_mrkr]
-    
-    return filter_on_same_sync_number(marker_sync_numbers, sync_numbers)
+    return fltr
 
 
 ##############################################################################
@@ -265,36 +382,70 @@ def fit_tail(fp, **kw):
     
     return ret0, ret1
 
+def fit_tail_from_folder(folder, **kw):
+    """
+    fit_tail for all measurement files in a folder (all sub-levels are 
+    searched); returns the list of results, in the order of the files.
+    """
+    processes = kw.pop('processes', None)
+    return files.map_msmt_files(fit_tail, folder, processes, **kw)
+
 ##############################################################################
 ### Teleportation events
 ##############################################################################
 
+def _photons_per_sync(photon_sync_numbers, photon_sync_times, sync_numbers):
+    """
+    for each of sync_numbers: the number of photons with that sync number, 
+    and the sync times of the first two of them (in the order of the data;
+    0 if there are fewer).
+    """
+    srt = np.argsort(photon_sync_numbers, kind='mergesort')
+    sn = photon_sync_numbers[srt]
+    st = photon_sync_times[srt]
+    
+    left = np.searchsorted(sn, sync_numbers, side='left')
+    right = np.searchsorted(sn, sync_numbers, side='right')
+    n = right - left
+    
+    times = np.zeros((len(sync_numbers), 2))
+    for j in range(2):
+        has = n > j
+        times[has,j] = st[left[has]+j]
+    
+    return n, times
+
 def get_teleportation_events(folder, force_eval=False, verbose=True):
-    fp = files.get_msmt_fp(folder)
+    """
+    the teleportation events of a measurement; folder is the measurement
+    folder, or the path of the measurement file itself.
+    """
+    if os.path.isfile(folder):
+        fp = folder
+    else:
+        fp = files.get_msmt_fp(folder)
     fname = files.get_msmt_name(fp)
 
-    if files.has_analysis_data(fp, 'teleportation_events') and not force_eval:
+    key = files.get_analysis_key(fp, PIPULSESEP=settings.PIPULSESEP)
+    if not force_eval and files.has_analysis_data(fp, 'teleportation_events', key=key):
         tev, _a = files.get_analysis_data(fp, 'teleportation_events')
         return tev
 
-    f = h5py.File(fp, 'r')
-    sync_times = f['/HH_sync_time-1'].value * 1e-3 # we prefer ns over ps
-    sync_numbers = f['/HH_sync_number-1'].value
-    channels = f['/HH_channel-1'].value
-    abs_times = f['/HH_time-1'].value
-    ad1_reps = f['{}/adwin_lt1_data/completed_reps'.format(fname)].value
-    ad1_ssro1 = f['{}/adwin_lt1_data/SSRO1_results'.format(fname)].value
-    ad1_ssro2 = f['{}/adwin_lt1_data/SSRO2_results'.format(fname)].value
-    ad2_reps = f['{}/adwin_lt2_data/completed_reps'.format(fname)].value
-    ad2_ssro = f['{}/adwin_lt2_data/SSRO_lt2_data'.format(fname)].value
-    ad1_CR_before = f['{}/adwin_lt1_data/CR_before'.format(fname)].value
-    ad2_CR_before = f['{}/adwin_lt2_data/CR_before'.format(fname)].value
-    ad1_CR_after = f['{}/adwin_lt1_data/CR_after'.format(fname)].value
-    ad2_CR_after = f['{}/adwin_lt2_data/CR_after'.format(fname)].value
+    hh = HHEventTable(fp)
+    sync_times = hh.sync_times * 1e-3 # we prefer ns over ps
+    sync_numbers = hh.sync_numbers
+    abs_times = hh.abs_times
+    ad1_reps = hh['{}/adwin_lt1_data/completed_reps'.format(fname)]
+    ad1_ssro1 = hh['{}/adwin_lt1_data/SSRO1_results'.format(fname)]
+    ad1_ssro2 = hh['{}/adwin_lt1_data/SSRO2_results'.format(fname)]
+    ad2_reps = hh['{}/adwin_lt2_data/completed_reps'.format(fname)]
+    ad2_ssro = hh['{}/adwin_lt2_data/SSRO_lt2_data'.format(fname)]
+    ad1_CR_before = hh['{}/adwin_lt1_data/CR_before'.format(fname)]
+    ad2_CR_before = hh['{}/adwin_lt2_data/CR_before'.format(fname)]
+    ad1_CR_after = hh['{}/adwin_lt1_data/CR_after'.format(fname)]
+    ad2_CR_after = hh['{}/adwin_lt2_data/CR_after'.format(fname)]
     
-    seq_reps = int(f['{}'.format(fname)].attrs['LDE_attempts_before_CR'])
-
-    f.close()
+    seq_reps = int(hh.open()['{}'.format(fname)].attrs['LDE_attempts_before_CR'])
 
     # binary encoding: 0 = 00, 1 = 01, 2 = 10, 3 = 11
     BSM_outcomes = (2**1 * ad1_ssro2) + (2**0 * ad1_ssro1)
@@ -305,20 +456,19 @@ def get_teleportation_events(folder, force_eval=False, verbose=True):
     psiplus_mrkr = 4
     # this conversion might be neccesary due to a wrong conversion in T2_tools.pyx
     # of the channel bits from a uint_32 to a uint_8. 
-    is_PLU_mrkr = get_markers(fp, 2**(PLU_mrkr-1))
-    has_same_sync_number_as_PLU_mrkr = filter_marker(fp, 2**(PLU_mrkr-1))
-    is_psiplus_mrkr = get_markers(fp, 2**(psiplus_mrkr-1))
-    is_psiminus_mrkr = get_markers(fp, 2**(psiminus_mrkr-1))
-    has_same_sync_number_as_psiminus_mrkr = filter_marker(fp, 2**(psiminus_mrkr-1))
-
-    is_ph_ch0, is_ph_ch1 = get_photons(fp)
+    is_PLU_mrkr = hh.markers(2**(PLU_mrkr-1))
+    is_psiplus_mrkr = hh.markers(2**(psiplus_mrkr-1))
+    is_psiminus_mrkr = hh.markers(2**(psiminus_mrkr-1))
+    
+    is_ph_ch0, is_ph_ch1 = hh.photons
     is_ph = is_ph_ch0 | is_ph_ch1
 
-    is_ph_with_PLU_mrkr = is_ph & filter_marker(fp, 2**(PLU_mrkr-1))
-    is_ph0_with_PLU_mrkr = is_ph_ch0 & filter_marker(fp, 2**(PLU_mrkr-1))
-    is_ph1_with_PLU_mrkr = is_ph_ch1 & filter_marker(fp, 2**(PLU_mrkr-1))
-    is_ph0_with_psiminus_mrkr = is_ph_ch0 & filter_marker(fp, 2**(psiminus_mrkr-1))
-    is_ph1_with_psiminus_mrkr = is_ph_ch1 & filter_marker(fp, 2**(psiminus_mrkr-1))
+    has_same_sync_number_as_PLU_mrkr = hh.marker_filter(2**(PLU_mrkr-1))
+    is_ph_with_PLU_mrkr = is_ph & has_same_sync_number_as_PLU_mrkr
+    is_ph0_with_PLU_mrkr = is_ph_ch0 & has_same_sync_number_as_PLU_mrkr
+    is_ph1_with_PLU_mrkr = is_ph_ch1 & has_same_sync_number_as_PLU_mrkr
+
+    hh.close()
 
     if settings.VERBOSE:
 
@@ -370,12 +520,9 @@ def get_teleportation_events(folder, force_eval=False, verbose=True):
     psi_minus_mrkr_sync_numbers = sync_numbers[is_psiminus_mrkr]
     psi_plus_mrkr_sync_numbers = sync_numbers[is_psiplus_mrkr]
 
-    attempts = np.zeros(PLU_mrkr_sync_numbers.size)
-    of = 0
-    for i, sn in enumerate(PLU_mrkr_sync_numbers):
-        a = (sn-of) % seq_reps
-        of = sn
-        attempts[i] = a
+    # attempt number: sync numbers since the previous PLU marker
+    attempts = np.diff(np.append(0, 
+        PLU_mrkr_sync_numbers.astype(np.int64))) % seq_reps
 
     ### Adwin SSROs
     if settings.VERBOSE:
@@ -400,57 +547,47 @@ def get_teleportation_events(folder, force_eval=False, verbose=True):
         
     # columns: sync no | attempt | ph1 arrival time | ph1 ch | ph2 arrival time | ph2 ch | dt | BSM outcome | Bob outcome |
     #          LDE_type (1 = psi-, 0 = psi+) | CR before 1 | CR after 1 | CR before 2 | CR after 2 | PLU mrkr abs. time
-    teleportation_events = np.empty((0,15))
-
-    for i,s in enumerate(PLU_mrkr_sync_numbers):
-        attempt = attempts[i]
-
-        _ph0 = LDE_ph0_sync_numbers==s
-        _ph1 = LDE_ph1_sync_numbers==s
-        
-        if len(LDE_ph0_sync_numbers[_ph0]) == 1 and len(LDE_ph1_sync_numbers[_ph1]) == 1:
-            psiminus = 1
-            stimes = np.array([ LDE_ph0_sync_times[_ph0], LDE_ph1_sync_times[_ph1] ]).reshape(-1)
-            chans = np.array([0,1])            
-
-        elif len(LDE_ph0_sync_numbers[_ph0]) == 2 and len(LDE_ph1_sync_numbers[_ph1]) == 0:
-            psiminus = 0
-            stimes = LDE_ph0_sync_times[_ph0].reshape(-1)
-            chans = np.array([0,0])
-
-        elif len(LDE_ph0_sync_numbers[_ph0]) == 0 and len(LDE_ph1_sync_numbers[_ph1]) == 2:
-            psiminus = 0
-            stimes = LDE_ph1_sync_times[_ph1].reshape(-1)
-            chans = np.array([1,1])
-
-        else:
-            continue
-
-        
-        idx = np.argsort(stimes)
-        atimes = stimes[idx]
-        atimes[1] -= settings.PIPULSESEP
-        chans = chans[idx]
-        dt = atimes[1] - atimes[0]
-       
-        _evnt = np.array([s, 
-            attempt,
-            atimes[0],
-            chans[0],
-            atimes[1],
-            chans[1],
-            dt,
-            BSM_outcomes[i],
-            ad2_ssro[i],
-            psiminus,
-            ad1_CR_before[i],
-            ad1_CR_after[i],
-            ad2_CR_before[i],
-            ad2_CR_after[i],
-            PLU_mrkr_abs_times[i],
-            ])
-
-        teleportation_events = np.vstack((teleportation_events, _evnt))
+    n0, ph0_times = _photons_per_sync(LDE_ph0_sync_numbers, LDE_ph0_sync_times, 
+        PLU_mrkr_sync_numbers)
+    n1, ph1_times = _photons_per_sync(LDE_ph1_sync_numbers, LDE_ph1_sync_times, 
+        PLU_mrkr_sync_numbers)
+
+    # valid are exactly one photon in each channel (psi-) or two photons in 
+    # the same channel (psi+)
+    is_psiminus = (n0 == 1) & (n1 == 1)
+    is_ch0_psiplus = (n0 == 2) & (n1 == 0)
+    is_ch1_psiplus = (n0 == 0) & (n1 == 2)
+    is_event = is_psiminus | is_ch0_psiplus | is_ch1_psiplus
+    
+    stimes = np.where(is_ch1_psiplus[:,np.newaxis], ph1_times, ph0_times)
+    stimes[is_psiminus,1] = ph1_times[is_psiminus,0]
+    chans = np.zeros(stimes.shape)
+    chans[is_psiminus,1] = 1
+    chans[is_ch1_psiplus] = 1
+    
+    # order the photons in time
+    swap = stimes[:,1] < stimes[:,0]
+    stimes[swap] = stimes[swap,::-1]
+    chans[swap] = chans[swap,::-1]
+    stimes[:,1] -= settings.PIPULSESEP
+
+    idx = np.where(is_event)[0]
+    teleportation_events = np.zeros((len(idx), T_EV_COLS))
+    teleportation_events[:,T_EV_COL_SYNCNUMBER] = PLU_mrkr_sync_numbers[idx]
+    teleportation_events[:,T_EV_COL_ATTEMPT] = attempts[idx]
+    teleportation_events[:,T_EV_COL_PH1_TIME] = stimes[idx,0]
+    teleportation_events[:,T_EV_COL_PH1_CHAN] = chans[idx,0]
+    teleportation_events[:,T_EV_COL_PH2_TIME] = stimes[idx,1]
+    teleportation_events[:,T_EV_COL_PH2_CHAN] = chans[idx,1]
+    teleportation_events[:,T_EV_COL_DT] = stimes[idx,1] - stimes[idx,0]
+    teleportation_events[:,T_EV_COL_BSM_RESULT] = BSM_outcomes[idx]
+    teleportation_events[:,T_EV_COL_BOB_RESULT] = ad2_ssro[idx]
+    teleportation_events[:,T_EV_COL_PSIMINUS] = is_psiminus[idx]
+    teleportation_events[:,T_EV_COL_CR1_BEFORE] = ad1_CR_before[idx]
+    teleportation_events[:,T_EV_COL_CR1_AFTER] = ad1_CR_after[idx]
+    teleportation_events[:,T_EV_COL_CR2_BEFORE] = ad2_CR_before[idx]
+    teleportation_events[:,T_EV_COL_CR2_AFTER] = ad2_CR_after[idx]
+    teleportation_events[:,T_EV_COL_PLU_ABS_TIME] = PLU_mrkr_abs_times[idx]
 
     if settings.VERBOSE:
         print
@@ -458,10 +595,20 @@ def get_teleportation_events(folder, force_eval=False, verbose=True):
         print '===================================='
         print 
 
-    files.set_analysis_data(fp, 'teleportation_events', teleportation_events)
+    files.set_analysis_data(fp, 'teleportation_events', teleportation_events, key=key)
 
     return teleportation_events
 
+def get_teleportation_events_from_folder(folder, **kw):
+    """
+    the teleportation events of all measurements in a folder (all sub-levels
+    are searched), concatenated in the order of the files.
+    """
+    processes = kw.pop('processes', None)
+    tevs = files.map_msmt_files(get_teleportation_events, folder, 
+        processes, **kw)
+    return np.vstack([np.zeros((0,T_EV_COLS))] + tevs)
+
 def filter_event_times(teleportation_events, **kw):
     ch0_start = kw.pop('ch0_start', settings.CH0_START)
     ch1_start = kw.pop('ch1_start', settings.CH1_START)
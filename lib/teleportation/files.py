@@ -1,5 +1,8 @@
 import h5py
 import os
+import hashlib
+import multiprocessing
+import numpy as np
 
 import settings
 
@@ -15,6 +18,34 @@ def get_all_msmt_filepaths(folder, suffix='hdf5', pattern=''):
     
     return filepaths
 
+def _apply(args):
+    func, fp, kw = args
+    return func(fp, **kw)
+
+def map_msmt_files(func, folder, processes=None, pattern='', **kw):
+    """
+    returns [ func(fp, **kw) for all measurement files fp in folder ] (all 
+    sub-levels are searched; the files are sorted by path, such that the 
+    result does not depend on the order of the file system).
+    with processes > 1 the files are distributed over a process pool of that
+    size; func must then be a module-level function.
+    """
+    if processes == None:
+        processes = settings.PROCESSES
+    filepaths = sorted(get_all_msmt_filepaths(folder, pattern=pattern))
+    args = [ (func, fp, kw) for fp in filepaths ]
+    
+    if processes <= 1 or len(filepaths) <= 1:
+        return map(_apply, args)
+    
+    pool = multiprocessing.Pool(min(processes, len(filepaths)))
+    try:
+        results = pool.map(_apply, args)
+    finally:
+        pool.close()
+        pool.join()
+    return results
+
 def get_msmt_name(fp):
     """
     This assumes that there is only one group, whose name is the msmt name.
@@ -41,17 +72,46 @@ def get_msmt_header(fp):
 
 
 ### basic functionality for analysis data
+# analysis results are not written into the measurement file, but into a 
+# separate analysis file next to it. the raw data is only ever opened
+# read-only.
+def get_analysis_fp(fp):
+    """
+    the path of the analysis file that belongs to the measurement file fp.
+    """
+    return os.path.splitext(fp)[0] + settings.ANALYSIS_FILE_SUFFIX
+
+def get_analysis_key(fp, **params):
+    """
+    a key (hex string) that identifies an analysis result by its input
+    parameters (scalars, strings, arrays, or None) and the state (size and 
+    modification time) of the measurement file.
+    """
+    key = hashlib.sha1()
+    key.update(repr((os.path.getsize(fp), os.path.getmtime(fp))))
+    for k in sorted(params):
+        v = params[k]
+        key.update(k)
+        if isinstance(v, np.ndarray):
+            key.update(repr((v.dtype.str, v.shape)))
+            key.update(np.ascontiguousarray(v).tostring())
+        else:
+            key.update(repr(v))
+    return key.hexdigest()
+
+def _analysis_grpname(subgroup):
+    return settings.ANALYSISGRP + ('/' + subgroup if subgroup!=None else '')
+
 def delete_analysis_data(fp, name, subgroup=None):
-    try:
-        f = h5py.File(fp, 'r+')
-    except:
-        print "Cannot open file", fp
-        raise
+    afp = get_analysis_fp(fp)
+    if not os.path.exists(afp):
+        return
 
+    f = h5py.File(afp, 'r+')
     try:
-        agrp = f.require_group(settings.ANALYSISGRP + ('/' + subgroup if subgroup!=None else ''))
-        if name in agrp.keys():
-            del agrp[name]
+        grpname = _analysis_grpname(subgroup)
+        if grpname in f and name in f[grpname].keys():
+            del f[grpname][name]
         f.flush()
         f.close()        
     except:
@@ -59,39 +119,28 @@ def delete_analysis_data(fp, name, subgroup=None):
         raise
 
 def clear_analysis_data(fp):
-    try:
-        f = h5py.File(fp, 'r+')
-    except:
-        print "Cannot open file", fp
-        raise
+    afp = get_analysis_fp(fp)
+    if os.path.exists(afp):
+        os.remove(afp)
 
-    if settings.ANALYSISGRP in f.keys():
-        try:
-            del f[settings.ANALYSISGRP]
-            f.flush()
-            f.close()
-        except:
-            f.close()
-            raise
-    else:
-        f.close()
-
-def set_analysis_data(fp, name, data, subgroup=None, **kw):
-    try:
-        f = h5py.File(fp, 'r+')
-    except:
-        print "Cannot open file", fp
-        raise
+def set_analysis_data(fp, name, data, subgroup=None, key=None, **kw):
+    """
+    store analysis data for the measurement file fp. kw are stored as 
+    attributes; key (see get_analysis_key) identifies the input of the
+    analysis (see has_analysis_data).
+    """
+    f = h5py.File(get_analysis_fp(fp), 'a')
     
     try:
-        agrp = f.require_group(settings.ANALYSISGRP + ('/' + subgroup if subgroup!=None else ''))
+        agrp = f.require_group(_analysis_grpname(subgroup))
         if name in agrp.keys():
             del agrp[name]
         agrp[name] = data
-        f.flush()
         
         for k in kw:
             agrp[name].attrs[k] = kw[k]
+        if key != None:
+            agrp[name].attrs['key'] = key
         
         f.flush()
         f.close()        
@@ -99,33 +148,29 @@ def set_analysis_data(fp, name, data, subgroup=None, **kw):
         f.close()
         raise
         
-def has_analysis_data(fp, name, subgroup=None):
-    try:
-        f = h5py.File(fp, 'r+')
-    except:
-        print "Cannot open file", fp
-        raise
-    
-    agrp = f.require_group(settings.ANALYSISGRP + ('/' + subgroup if subgroup!=None else ''))
-    if name in agrp.keys():
-        f.close()
-        return True
-    else:
-        f.close()
+def has_analysis_data(fp, name, subgroup=None, key=None):
+    """
+    whether there is analysis data with that name; if key is given, only
+    if it has been computed with the same key.
+    """
+    afp = get_analysis_fp(fp)
+    if not os.path.exists(afp):
         return False
     
+    f = h5py.File(afp, 'r')
+    grpname = _analysis_grpname(subgroup)
+    has_data = grpname in f and name in f[grpname].keys()
+    if has_data and key != None:
+        has_data = f[grpname][name].attrs.get('key', None) == key
+    f.close()
+    return has_data
+    
 def get_analysis_data(fp, name, subgroup=None):
-    try:
-        f = h5py.File(fp, 'r+')
-    except:
-        print "Cannot open file", fp
-        raise
-        
-    agrp = f.require_group(settings.ANALYSISGRP + ('/' + subgroup if subgroup!=None else ''))
-
-    if name not in agrp.keys():
+    if not has_analysis_data(fp, name, subgroup):
         return None
-    
+
+    f = h5py.File(get_analysis_fp(fp), 'r')
+    agrp = f[_analysis_grpname(subgroup)]
     dat = agrp[name].value
     attrs = {}
     for (an, av) in agrp[name].attrs.items():
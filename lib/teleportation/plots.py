@@ -103,15 +103,16 @@ def plot_tail(fp, **kw):
 def plot_PLU_filter(folder):
     fp = files.get_msmt_fp(folder)
 
-    # get the PLU marked photons first
-    is_ph_ch0, is_ph_ch1 = events.get_photons(fp)
+    # get the PLU marked photons first; the HH data is read only once
+    hh = events.HHEventTable(fp)
+    is_ph_ch0, is_ph_ch1 = events.get_photons(fp, hh=hh)
     is_ph = is_ph_ch0 | is_ph_ch1
-    is_ph_with_PLU_mrkr = is_ph & events.filter_marker(fp, 2)
+    is_ph_with_PLU_mrkr = is_ph & events.filter_marker(fp, 2, hh=hh)
 
     # first window
     fig, (ax0, ax1) = plot_photon_hist_filter_comparison(
         fp, save=False, fltr=is_ph_with_PLU_mrkr, log=True,
-        binedges=settings.PHOTONHIST_BINEDGES)
+        binedges=settings.PHOTONHIST_BINEDGES, hh=hh)
 
     ax0.axvline(settings.CH0_START, color='k', linestyle='--')
     ax0.text(settings.CH0_START+1, 1, '{} ns'.format(settings.CH0_START), color='k')
@@ -128,7 +129,7 @@ def plot_PLU_filter(folder):
     # second window
     fig, (ax0, ax1) = plot_photon_hist_filter_comparison(
         fp, save=False, fltr=is_ph_with_PLU_mrkr, log=True,
-        binedges=settings.PHOTONHIST_BINEDGES + settings.PIPULSESEP)
+        binedges=settings.PHOTONHIST_BINEDGES + settings.PIPULSESEP, hh=hh)
 
     ax0.axvline(settings.CH0_START+settings.PIPULSESEP, color='k', linestyle='--')
     ax0.text(settings.CH0_START+settings.PIPULSESEP+1, 
@@ -143,6 +144,7 @@ def plot_PLU_filter(folder):
     ax1.set_title('PLU (hardware) filter second pi-pulse ch1')
      
     fig.savefig(os.path.join(folder, 'PLU_photons_window2.png'))
+    hh.close()
 
 
 ##############################################################################
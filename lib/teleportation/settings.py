@@ -1,8 +1,20 @@
 import numpy as np
 
-# name of the group (top-level) in the data that contains all analysis results
+# name of the group (top-level) in the analysis file that contains all analysis results
 ANALYSISGRP = 'analysis'
 
+# analysis results are stored in <measurement file name><suffix>
+ANALYSIS_FILE_SUFFIX = '_analysis.h5'
+
+# print information about the data while analyzing
+VERBOSE = True
+
+# number of processes for the folder-level analysis (1: no process pool)
+PROCESSES = 1
+
+# number of HH events that are read from a file at once
+HH_CHUNKSIZE = 2**22
+
 # where in the stats array of the adwin data is the number of sequence starts?
 ADWIN1STATS_SEQSTARTS_IDX = 6
 
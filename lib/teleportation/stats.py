@@ -16,14 +16,9 @@ def get_sequence_starts(fp):
     
     return adwin1stats[settings.ADWIN1STATS_SEQSTARTS_IDX]
 
-def get_sequence_starts_from_folder(folder):
-    filepaths = files.get_all_msmt_filepaths(folder)
-    
-    starts = 0
-    for f in filepaths:
-        start += get_sequence_starts(f)
-
-    return starts
+def get_sequence_starts_from_folder(folder, processes=None):
+    starts = files.map_msmt_files(get_sequence_starts, folder, processes)
+    return sum(starts)
 
 
 ##############################################################################
@@ -77,7 +72,7 @@ def _make_CR_hist(fp, adwin, data_name, **kw):
     f.close()
 
     binedges = np.arange(-0.5, vals.max()+0.5)
-    h,b = np.histogram(vals, bins=binedges, density=True)
+    h,b = np.histogram(vals, bins=binedges, density=normalize)
 
     return h,b
 
@@ -89,7 +84,23 @@ def get_CR_hist_after(fp, adwin, **kw):
     data_name = 'CR_after'
     return _make_CR_hist(fp, adwin, data_name, **kw)
 
-
-
-
-
+def get_CR_hist_from_folder(folder, func, adwin, processes=None, **kw):
+    """
+    the sum of the CR histograms func(fp, adwin) (one of the get_CR_hist_* 
+    functions) of all files in folder.
+    """
+    normalize = kw.pop('normalize', True)
+    hists = files.map_msmt_files(func, folder, processes, adwin=adwin, 
+        normalize=False)
+
+    # the histograms start at zero counts, but have different lengths
+    longest = np.argmax([ len(h) for h,b in hists ])
+    h = np.zeros(len(hists[longest][0]))
+    for _h,_b in hists:
+        h[:len(_h)] += _h
+    b = hists[longest][1]
+    
+    # all bins have unit width
+    if normalize:
+        h /= float(h.sum())
+    return h, b
@@ -0,0 +1,83 @@
+"""
+benchmark of hht3.filter_overflows against the original per-overflow loop,
+on synthetic T3 events with 1e6 to 1e8 events and 50% and 1% overflow
+records.
+
+the new version is timed on T3_DTYPE records (as from decode_chunks), and,
+together with the old loop, on Nx4 uint64 event matrices; the old loop is
+only run up to OLD_MAX events (it takes minutes beyond).
+usage: python filter_overflows_benchmark.py [max_noof_events]
+"""
+
+import sys, time
+import numpy as np
+
+from analysis.lib.pq import hht3
+
+MAX_EVENTS = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**8
+OLD_MAX = 10**7
+OFL_FRACTIONS = [0.5, 0.01]
+
+def filter_overflows_old(data, ofl_offset=0):
+    # the implementation before the cumsum, without the prints
+    idx_ofl = np.where(data[:,2]==63)[0]
+    if len(idx_ofl) == 0:
+        data[:,0] += ofl_offset*1024
+        return data, ofl_offset
+
+    for i,idx in np.ndenumerate(idx_ofl):
+        if i[0] == 0:
+            data[:idx,0] += ofl_offset*1024
+
+        if idx == idx_ofl[-1]:
+            data[idx:,0] += (i[0]+ofl_offset)*1024
+        else:
+            data[idx:idx_ofl[i[0]+1], 0] += (i[0]+ofl_offset)*1024
+
+    return np.delete(data, idx_ofl, axis=0), i[0]+ofl_offset
+
+def records(n, ofl_fraction, seed=0):
+    rs = np.random.RandomState(seed)
+    data = np.zeros(n, dtype=hht3.T3_DTYPE)
+    data['sync'] = rs.randint(0, 1024, n)
+    data['time'] = rs.randint(0, 4000, n)
+    data['channel'] = np.where(rs.rand(n) < ofl_fraction, 63,
+            rs.randint(0, 2, n))
+    data['special'] = data['channel'] == 63
+    return data
+
+def matrix(rec):
+    data = np.empty((len(rec),4), dtype=np.uint64)
+    for i,name in enumerate(hht3.T3_FIELDS):
+        data[:,i] = rec[name]
+    return data
+
+def timed(func, *args):
+    t0 = time.time()
+    ret = func(*args)
+    return ret, time.time()-t0
+
+if __name__ == '__main__':
+    print '%9s %5s %10s %10s %10s' % ('events', 'ofl', 'old [s]',
+            'new [s]', 'records [s]')
+    n = 10**6
+    while n <= MAX_EVENTS:
+        for frac in OFL_FRACTIONS:
+            # the syncs are corrected in place, so rec is filtered last
+            rec = records(n, frac)
+            t_old = t_new = np.nan
+            if n <= OLD_MAX:
+                (old, old_ofls), t_old = timed(filter_overflows_old,
+                        matrix(rec), 3)
+                (new, new_ofls), t_new = timed(hht3.filter_overflows,
+                        matrix(rec), 3)
+                assert np.array_equal(old, new) and old_ofls == new_ofls
+            (new_rec, ofls), t_rec = timed(hht3.filter_overflows, rec, 3)
+            if n <= OLD_MAX:
+                assert np.array_equal(matrix(new_rec), old) and \
+                        ofls == old_ofls
+                del old, new
+            print '%9.0e %5.2f %10.3f %10.3f %10.3f' % (n, frac, t_old,
+                    t_new, t_rec)
+            del rec, new_rec
+        n *= 10
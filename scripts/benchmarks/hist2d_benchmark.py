@@ -0,0 +1,73 @@
+"""
+benchmark of pq.hist2d against the Cython hist2d in
+scripts/teleportation/T2_filter_files, on 1e8 synthetic events (1% markers,
+photons spread over the sync time range of a T2 measurement).
+
+the compiled variants are only timed if they have been built (python
+setup.py build_ext --inplace in lib/pq/hist2d_files and in T2_filter_files,
+respectively). usage: python hist2d_benchmark.py [noof_events]
+"""
+
+import sys, time
+import numpy as np
+
+from analysis.lib.pq import hist2d
+
+try:
+    from analysis.scripts.teleportation.T2_filter_files import T2_filter
+except ImportError:
+    T2_filter = None
+
+NOOF_EVENTS = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**8
+BLOCK = 10**7
+
+# period, pts, t_start, t_stop, t_bins
+ARGS = (100, 11, 10.145e6, 10.19e6, 200)
+
+def events(n, seed=0):
+    rs = np.random.RandomState(seed)
+    special = np.zeros(n, np.uint8)
+    channel = np.empty(n, np.uint8)
+    sync_time = np.empty(n, np.uint64)
+    for s in range(0, n, BLOCK):
+        e = min(n, s+BLOCK)
+        special[s:e] = rs.rand(e-s) < 0.01
+        channel[s:e] = rs.randint(0, 2, e-s)
+        sync_time[s:e] = rs.randint(10140000, 10200000, e-s)
+    return channel, special, sync_time
+
+def timed(label, func, *args, **kw):
+    t0 = time.time()
+    ret = func(*args, **kw)
+    print '%-32s %7.2f s' % (label, time.time()-t0)
+    return ret
+
+if __name__ == '__main__':
+    print 'generating %.0e events' % NOOF_EVENTS
+    channel, special, sync_time = events(NOOF_EVENTS)
+
+    ref = None
+    if T2_filter is not None:
+        ref, _ = timed('T2_filter.hist2d (Cython)', T2_filter.hist2d,
+                channel, special, sync_time, *(ARGS + (1,)))
+    else:
+        print 'T2_filter not built, skipped'
+
+    h, _ = timed('hist2d, numpy', hist2d.hist2d, channel, special,
+            sync_time, *ARGS, hist_channel=1, compiled=False)
+    if ref is not None:
+        assert np.array_equal(h, ref)
+    ref = h
+
+    if hist2d.hist2d_c is not None:
+        h, _ = timed('hist2d, compiled', hist2d.hist2d, channel, special,
+                sync_time, *ARGS, hist_channel=1, compiled=True)
+        assert np.array_equal(h, ref)
+        h2, _ = timed('hist2d, compiled, 2 channels', hist2d.hist2d,
+                channel, special, sync_time, *ARGS, hist_channel=[0,1],
+                compiled=True)
+        assert np.array_equal(h2[1], ref)
+    else:
+        print 'hist2d_c not built, skipped'
+
+    print 'histograms agree, %d counts' % ref.sum()
@@ -0,0 +1,84 @@
+"""
+benchmark of MBIAnalysis.get_correlations (10 readouts, 100 sweep points,
+1e5 repetitions) against the original loop over all correlations and sweep
+points, on synthetic readout results written to a temporary measurement
+folder.
+
+the old loop is timed with OLD_REPS repetitions (it takes minutes for
+1e5), and checked against the new version on the same data.
+usage: python mbi_correlations_benchmark.py [reps]
+"""
+
+import os, sys, time, shutil, tempfile
+import numpy as np
+import h5py
+
+from analysis.lib.m2.ssro import mbi
+
+READOUTS = 10
+PTS = 100
+REPS = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**5
+OLD_REPS = 10**4
+
+def correlations_old(results, reps, pts, readouts):
+    # the implementation before the bincount
+    _res = results.reshape((-1,pts,readouts))
+    c = np.zeros((reps, pts))
+    for i in range(readouts):
+        c += 2**i * (1-_res[:,:,i])
+
+    corrvals = range(2**readouts)
+    correlations = np.zeros((pts, len(corrvals)))
+    for v in corrvals:
+        for p in range(pts):
+            correlations[p,v] = len(np.where(c[:,p]==v)[0])
+    return correlations
+
+def measurement(folder, reps, seed=0):
+    """
+    writes an MBI measurement with random readout results to folder and
+    returns the results.
+    """
+    name = os.path.split(folder)[1]
+    os.makedirs(folder)
+    rs = np.random.RandomState(seed)
+    results = (rs.rand(reps*PTS*READOUTS) < 0.3).astype(np.uint32)
+
+    f = h5py.File(os.path.join(folder, name+'.hdf5'), 'w')
+    g = f.create_group(name)
+    g.attrs['reps_per_ROsequence'] = reps
+    grp = g.create_group('adwindata')
+    grp.attrs['sweep_length'] = PTS
+    grp.attrs['nr_of_ROsequences'] = READOUTS
+    grp['ssro_results'] = results
+    f.close()
+    return results
+
+def get_correlations(folder):
+    a = mbi.MBIAnalysis(folder)
+    t0 = time.time()
+    a.get_correlations('adwindata')
+    t = time.time()-t0
+    a.finish()
+    return a.correlations, t
+
+if __name__ == '__main__':
+    tmp = tempfile.mkdtemp()
+    try:
+        folder = os.path.join(tmp, '20130101', '120000_MBI_benchmark')
+        measurement(folder, REPS)
+        c, t = get_correlations(folder)
+        print '%d readouts x %d pts x %.0e reps: %.2f s' % (READOUTS, PTS,
+                REPS, t)
+
+        folder = os.path.join(tmp, '20130101', '120001_MBI_benchmark')
+        results = measurement(folder, OLD_REPS, seed=1)
+        c, t = get_correlations(folder)
+        t0 = time.time()
+        c_old = correlations_old(results, OLD_REPS, PTS, READOUTS)
+        t_old = time.time()-t0
+        assert np.array_equal(c, c_old)
+        print 'at %.0e reps: %.2f s, old loop %.2f s, identical' % (OLD_REPS,
+                t, t_old)
+    finally:
+        shutil.rmtree(tmp)
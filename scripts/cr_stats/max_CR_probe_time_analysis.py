@@ -46,7 +46,7 @@ for i,g in enumerate(a.g.items()):
     a.get_run(gn)
     max_t = int(string.split(gn, '_')[2])
 
-    _t, _c = a.readout_relaxation(a.ro_time, a.ro_counts, a.reps, a.binsize, name=gn,
+    _t, _c = a.readout_relaxation(a.ro_time, a.ro_data, a.reps, a.binsize, name=gn,
             plot=False, ret=True)
 
     idx0 = argmax(_c)
@@ -9,8 +9,6 @@ from analysis.lib.fitting import fit, common
 from analysis.lib.tools import plot
 from analysis.lib.tools import toolbox
 from analysis.lib.m2.ssro import ssro
-from analysis.lib.m2.ssro import sequence
-reload(sequence)
 
 
 folder = None
@@ -24,7 +22,11 @@ if folder == None:
         folder = toolbox.latest_data('AdwinSSRO')
 
 a = ssro.SSROAnalysis(folder)
-b = sequence.SequenceAnalysis(folder)
+
+# CR and readout statistics of all threshold groups, in a single pass
+stats = a.threshold_stats()
+binsize = a.binsize
+a.finish()
 
 runs = 1
 sweep_probes = 1 # 2 if also analyze_probe, 1 if only preselect.
@@ -50,16 +52,9 @@ favo_u_k = []
 
 # analyze the data
 
-for i,g in enumerate(a.g.items()):    
-    gn = g[0]
-    if 'instrument_settings' in gn:
-        continue
-    if i>7:
-        continue
-
-    a.get_run(gn)
-    pre = int(string.split(gn, '_')[2])
-    pro = int(string.split(gn, '_')[4])
+for i,gn in enumerate(stats['names']):
+    pre = int(stats['preselect'][i])
+    pro = int(stats['probe'][i])
     run = int(string.split(gn, '_')[6])
     analyze_probe = str(string.split(gn, '_')[8])
 
@@ -74,8 +69,10 @@ for i,g in enumerate(a.g.items()):
         th = pre
         probe = 0
 
-    _t, _c = a.readout_relaxation(a.ro_time, a.ro_counts, a.reps, a.binsize, name=gn,
-            plot=False, ret=True)
+    # readout relaxation, as readout_relaxation(..., lastbin=-1)
+    _c = stats['ro_countrate'][i]
+    _c = _c[np.isfinite(_c)][:-1]
+    _t = np.arange(len(_c)) * binsize * 1e3
 
     idx0 = np.argmax(_c)
     idx1 = -1 
@@ -99,15 +96,18 @@ for i,g in enumerate(a.g.items()):
     ax.set_title(a.default_plot_title + ', ' + gn)
     fig.savefig(os.path.join(folder, 'sp_relaxation_Th_pre={}_Th_pro={}_run_{}_sweep_{}'.format(pre,pro, run, th)))
 
-    b.get_cr_results(gn, plot=True)
+    cr_hist = stats['cr_hist'][i]
+    fig = a.default_fig(figsize=(6,4))
+    ax = a.default_ax(fig)
+    ax.bar(np.arange(len(cr_hist)), cr_hist, width=1, align='center')
+    ax.set_xlabel('counts during CR check sequence')
+    ax.set_ylabel('probability')
+    ax.set_title(a.default_plot_title + ': CR after ' + gn)
+    fig.savefig(os.path.join(folder, 'cr_check_after_'+gn+'.'+a.plot_format),
+            format=a.plot_format)
 
-    hist,mean,var = b.get_mean_cr_cts()
-    means[probe][run-1].append(mean[0])
-
-    stats = b.adwingrp(gn)['statistics'].value
-    fail = stats[2]
-    percentage_pass = 5000./(5000. + fail) * 100 #5000 is the number of succesfull measurements.
-    percentage_passes[probe][run-1].append(percentage_pass)
+    means[probe][run-1].append(stats['cr_mean'][i])
+    percentage_passes[probe][run-1].append(stats['cr_pass'][i])
 
     plt.close('all')
 
@@ -215,11 +215,3 @@ if runs > 2 and sweep_probes > 1:
         os.path.join(folder, 'CR_passes_vs_run_for_ths_{}_{}'.format(30,favo_th)),
         format='png')
 
-
-
-
-
-a.finish()
-b.finish() 
-        
-               
@@ -9,8 +9,7 @@ from matplotlib import rcParams
 
 from analysis.lib.fitting import fit
 from analysis import config
-
-import MLE
+from analysis.lib.lde import mle
 
 config.outputdir = r'/Users/wp/Documents/TUD/LDE/analysis/output'
 config.datadir = r'/Volumes/MURDERHORN/TUD/LDE/analysis/data/lde'
@@ -58,42 +57,18 @@ for i,win1 in enumerate(corr['win1vals']):
     edges = np.append(0,dtvals)
     meandtvals = edges[:-1] + (edges[1:]-edges[:-1])/2.
 
-    # do an MLE for each dt bin
-    F = np.array([])
-    u_F = np.array([])
-
-    FLB = np.array([])
-    u_FLB = np.array([])
+    # do an MLE for each dt bin (full 101 point grid and gaussian fits, as
+    # the bounds quoted so far; method='moments' is independent of binning)
+    res = mle.fidelity_sweep(c[...,ZZidx,:], c[...,XXidx,:], c[...,XmXidx,:],
+            state=state, prob_pts=101, method='fit')
+    F, u_F = res['F'], res['u_F']
+    FLB, u_FLB = res['FLB'], res['u_FLB']
 
     # max probability for not having entanglement
-    PNE = np.array([])
-    sigmas = np.array([])
-    N = np.array([])
-
-    for i,dt in enumerate(dtvals):
-        emily = MLE.Emily()
-        emily.prob_pts = 101
-        emily.state = state
-        emily.N_ZZ = c[i,...,ZZidx,:]
-        emily.N_XX = c[i,...,XXidx,:]
-        emily.N_XmX = c[i,...,XmXidx,:]
-        emily.fac_exact = 1
-        emily.likelihood()
-        emily.analysis(savefn='MLE_win1%d_win2%d_dt%d' \
-                % (win1,win2,dt), save=False)
-        
-        F = np.append(F, emily.F)
-        u_F = np.append(u_F, emily.u_F)
-        
-        FLB = np.append(FLB, emily.FLB)
-        u_FLB = np.append(u_FLB, emily.u_FLB)
-        
-        PNE = np.append(PNE, 0.5 * abs(1. - \
-                erf((emily.FLB-0.5)/np.sqrt(2.)/emily.u_FLB)))
-        sigmas = np.append(sigmas, (emily.FLB-0.5)/emily.u_FLB)
-        N = np.append(N, emily.N_ZZ.sum()+emily.N_XX.sum()+emily.N_XmX.sum())
-        
-        plt.close('all')
+    PNE = 0.5 * abs(1. - erf((FLB-0.5)/np.sqrt(2.)/u_FLB))
+    sigmas = (FLB-0.5)/u_FLB
+    N = c[...,ZZidx,:].sum(-1) + c[...,XXidx,:].sum(-1) + \
+            c[...,XmXidx,:].sum(-1)
 
     fig = plt.figure(figsize=(12,8))
     ax = fig.add_subplot(111)
@@ -148,42 +123,18 @@ for i,win2 in enumerate(corr['win2vals']):
     edges = np.append(0,dtvals)
     meandtvals = edges[:-1] + (edges[1:]-edges[:-1])/2.
 
-    # do an MLE for each dt bin
-    F = np.array([])
-    u_F = np.array([])
-
-    FLB = np.array([])
-    u_FLB = np.array([])
+    # do an MLE for each dt bin (full 101 point grid and gaussian fits, as
+    # the bounds quoted so far; method='moments' is independent of binning)
+    res = mle.fidelity_sweep(c[...,ZZidx,:], c[...,XXidx,:], c[...,XmXidx,:],
+            state=state, prob_pts=101, method='fit')
+    F, u_F = res['F'], res['u_F']
+    FLB, u_FLB = res['FLB'], res['u_FLB']
 
     # max probability for not having entanglement
-    PNE = np.array([])
-    sigmas = np.array([])
-    N = np.array([])
-
-    for i,dt in enumerate(dtvals):
-        emily = MLE.Emily()
-        emily.prob_pts = 101
-        emily.state = state
-        emily.N_ZZ = c[i,...,ZZidx,:]
-        emily.N_XX = c[i,...,XXidx,:]
-        emily.N_XmX = c[i,...,XmXidx,:]
-        emily.fac_exact = 1
-        emily.likelihood()
-        emily.analysis(savefn='MLE_win1%d_win2%d_dt%d' \
-                % (win1,win2,dt), save=False)
-        
-        F = np.append(F, emily.F)
-        u_F = np.append(u_F, emily.u_F)
-        
-        FLB = np.append(FLB, emily.FLB)
-        u_FLB = np.append(u_FLB, emily.u_FLB)
-        
-        PNE = np.append(PNE, 0.5 * abs(1. - \
-                erf((emily.FLB-0.5)/np.sqrt(2.)/emily.u_FLB)))
-        sigmas = np.append(sigmas, (emily.FLB-0.5)/emily.u_FLB)
-        N = np.append(N, emily.N_ZZ.sum()+emily.N_XX.sum()+emily.N_XmX.sum())
-        
-        plt.close('all')
+    PNE = 0.5 * abs(1. - erf((FLB-0.5)/np.sqrt(2.)/u_FLB))
+    sigmas = (FLB-0.5)/u_FLB
+    N = c[...,ZZidx,:].sum(-1) + c[...,XXidx,:].sum(-1) + \
+            c[...,XmXidx,:].sum(-1)
 
     fig = plt.figure(figsize=(12,8))
     ax = fig.add_subplot(111)
@@ -35,7 +35,7 @@ for g in a.g.items():
     #a.get_run('ms0')
    
     pwr = float(string.split(gn, '_')[-2])
-    _t, _c = a.readout_relaxation(a.ro_time, a.ro_counts, a.reps, a.binsize, name=gn,
+    _t, _c = a.readout_relaxation(a.ro_time, a.ro_data, a.reps, a.binsize, name=gn,
             plot=False, ret=True)
 
     idx0 = argmax(_c)+1
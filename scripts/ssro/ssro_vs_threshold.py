@@ -21,27 +21,28 @@ if folder == None:
         folder = toolbox.latest_data('AdwinSSRO')
 
 a = ssro.SSROAnalysis(folder)
-b = sequence.SequenceAnalysis(folder)
 
-runs = 8
+# CR and readout statistics of all threshold groups, in a single pass
+stats = a.threshold_stats()
+binsize = a.binsize
+a.finish()
+
 sweep_probes = 2 # 2 if also analyze_probe, 1 if only preselect.
+run_nrs = sorted(set([ int(string.split(gn, '_')[6]) for gn in stats['names'] ]))
+runs = len(run_nrs)
 
 ths = [ [ [ ] for i in range (runs)] for s in range (sweep_probes) ] 
 taus = [ [ [ ] for i in range (runs)] for s in range (sweep_probes) ] 
 u_taus =[ [ [ ] for i in range (runs)] for s in range (sweep_probes) ] 
 means = [ [ [ ] for i in range (runs)] for s in range (sweep_probes) ] 
-precentage_passes = [ [ [ ] for i in range (runs)] for s in range (sweep_probes) ] 
+percentage_passes = [ [ [ ] for i in range (runs)] for s in range (sweep_probes) ] 
 
-for g in a.g.items():    
-    gn = g[0]
-    if 'instrument_settings' in gn:
-        continue
-    
-    a.get_run(gn)
-    pre = float(string.split(gn, '_')[2])
-    pro = float(string.split(gn, '_')[4])
-    run = float(string.split(gn, '_')[6])
+for i,gn in enumerate(stats['names']):
+    pre = stats['preselect'][i]
+    pro = stats['probe'][i]
+    run = int(string.split(gn, '_')[6])
     analyze_probe = float(string.split(gn, '_')[8])
+    r = run_nrs.index(run)
     
     if analyze_probe:
         th = pro
@@ -50,11 +51,13 @@ for g in a.g.items():
         th = pre
         probe = 0
 
-    _t, _c = a.readout_relaxation(a.ro_time, a.ro_counts, a.reps, a.binsize, name=gn,
-            plot=False, ret=True)
+    # readout relaxation, as readout_relaxation(..., lastbin=-1)
+    _c = stats['ro_countrate'][i]
+    _c = _c[np.isfinite(_c)][:-1]
+    _t = np.arange(len(_c)) * binsize * 1e3
 
-    idx0 = argmax(_c)
-    idx1 = -1   qq
+    idx0 = np.argmax(_c)
+    idx1 = -1
     t,c = _t[idx0:idx1]/1e3, _c[idx0:idx1]
 
     fig = plt.figure(figsize=(6,6))
@@ -66,33 +69,18 @@ for g in a.g.items():
     
     if res != False:
         plot.plot_fit1d(res, t, ax=ax, plot_data=False)
-        ths[probe][run].append(th)
-        taus[probe][run].append(res['params_dict']['tau'])
-        u_taus[probe][run].append(res['error_dict']['tau'])
+        ths[probe][r].append(th)
+        taus[probe][r].append(res['params_dict']['tau'])
+        u_taus[probe][r].append(res['error_dict']['tau'])
+        means[probe][r].append(stats['cr_mean'][i])
+        percentage_passes[probe][r].append(stats['cr_pass'][i])
 
     ax.set_xlabel('t ($\mu$s)')
     ax.set_ylabel('cts (Hz)')
     ax.set_title(a.default_plot_title + ', ' + gn)
-    fig.savefig(os.path.join(folder, 'sp_relaxation_Th_pre={}_Th_pro={}_run_{}_sweep_{}'.format(int(pre),int(pro), run, th)))
-    plt.close('all')
-
-
-    b.get_cr_results(gn, plot=True)
+    fig.savefig(os.path.join(folder, 'sp_relaxation_Th_pre={}_Th_pro={}_run_{}_sweep_{}'.format(int(pre),int(pro), run, int(th))))
     plt.close('all')
 
-    mean = a.get_mean_cr_cts()
-    means[probe][run].append(mean)
-    
-    stats = a.adwingrp(name)['statistics'].value
-    fail = stats[2]
-    percentage_pass = 5000./(5000. + fail) * 100 #5000 is the number of succesfull measurements.
-    percentage_passes[probe][run].append(percentage_pass)
-
-
-plt.close('all')
-a.finish()
-b.finish()
-
 print ths
 print taus
 print means
@@ -100,47 +88,51 @@ print percentage_passes
 
 
 for r in np.arange(runs):
-    for a in np.arange(sweep_probes):
-        if a == 1:
-            p = probe
+    for s in np.arange(sweep_probes):
+        if len(ths[s][r]) == 0:
+            continue
+        if s == 1:
+            p = 'probe'
         else:
-            p = preselect
+            p = 'preselect'
 
-        sortidxs = argsort(ths[a][r])
-        ths[a][r] = np.array(ths[a][r])[sortidxs][:]
-        taus[a][r] = np.array(taus[a][r])[sortidxs][:]
-        u_taus[a][r] = np.array(u_taus[a][r])[sortidxs][:]
+        sortidxs = np.argsort(ths[s][r])
+        th = np.array(ths[s][r])[sortidxs]
+        tau = np.array(taus[s][r])[sortidxs]
+        u_tau = np.array(u_taus[s][r])[sortidxs]
+        mean = np.array(means[s][r])[sortidxs]
+        percentage_pass = np.array(percentage_passes[s][r])[sortidxs]
 
-        ks[a][r] = 1./taus[a][r] * 1e3
-        u_ks[a][r] = 1./taus[a][r]**2 * u_taus[a][r] * 1e3
+        k = 1./tau * 1e3
+        u_k = 1./tau**2 * u_tau * 1e3
 
         fig = plt.figure(figsize=(4,4))
         ax = fig.add_subplot(111)
-        ax.errorbar(ths[a][r], ks[a][r], yerr=u_ks[a][r], fmt='o', capsize=0, elinewidth=2)
+        ax.errorbar(th, k, yerr=u_k, fmt='o', capsize=0, elinewidth=2)
 
         ax.set_xlabel('{} threshold'.format(p))
         ax.set_ylabel('relaxation rate (kHz)')
-        ax.set_title(a.timestamp + '\n{} threshold for run {}'.format(p,r))
-
-        fig.savefig(os.path.join(folder, '{}_threshold_calib_run_{}'.format(p,r)))
+        ax.set_title(a.timestamp + '\n{} threshold for run {}'.format(p,run_nrs[r]))
 
+        fig.savefig(os.path.join(folder, '{}_threshold_calib_run_{}'.format(p,run_nrs[r])))
 
         fig = a.default_fig(figsize=(6,4))
         ax = a.default_ax(fig)
-        ax.plot(ths, means[a][r],'o')
-        ax.set_xlabel('sweep threshold')
+        ax.plot(th, mean,'o')
+        ax.set_xlabel('{} threshold'.format(p))
         ax.set_ylabel('mean CR counts after sequence')
 
         fig.savefig(
-            os.path.join(folder, 'post-CR_sum_vs_sweepparam.png'),
+            os.path.join(folder, 'post-CR_sum_vs_{}_threshold_run_{}.png'.format(p,run_nrs[r])),
             format='png')
 
         fig = a.default_fig(figsize=(6,4))
         ax = a.default_ax(fig)
-        ax.plot(ths[a][r], percentage_passes[a][r],'o')
-        ax.set_xlabel('sweep threshold')
+        ax.plot(th, percentage_pass,'o')
+        ax.set_xlabel('{} threshold'.format(p))
         ax.set_ylabel('percentage CR passes')
 
         fig.savefig(
-            os.path.join(folder, 'percentage_CR_pass_vs_sweepparam.png'),
-            format='png')
\ No newline at end of file
+            os.path.join(folder, 'percentage_CR_pass_vs_{}_threshold_run_{}.png'.format(p,run_nrs[r])),
+            format='png')
+        plt.close('all')
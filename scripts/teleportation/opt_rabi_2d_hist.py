@@ -1,7 +1,7 @@
 import numpy as np
 import h5py
 
-import T2_filter
+from analysis.lib.pq import hist2d
 
 ### Analysis settings
 FN = r'D:\measuring\data\20130823\002947_Teleportation_testing_lt2-9_optical_rabi\002947_Teleportation_testing_lt2-9_optical_rabi.hdf5'
@@ -17,7 +17,7 @@ def get_hist(fn=FN):
     special = f['/HH_special-1'].value
     sync_time = f['/HH_sync_time-1'].value
     f.close()
-    h2d, binedges = T2_filter.hist2d(channel, special, sync_time,
+    h2d, binedges = hist2d.hist2d(channel, special, sync_time,
         100, len(sweep_pts), t0, t1, bins, 1)
     
     return h2d, binedges
@@ -0,0 +1,73 @@
+"""
+regression tests for hht3.filter_decreasing_syncs against the original
+(quadratic) implementation, on data with a corrupted head.
+"""
+
+import numpy as np
+
+from analysis.lib.pq import hht3
+
+
+def _filter_decreasing_syncs_old(data):
+    # the implementation before the vectorization, without the prints
+    minsync = np.argmin(data[:,0])
+    data = data[minsync:,]
+
+    while not all([x<=y for x,y in zip(data[:,0],data[1:,0])]):
+        data = data[1:,:]
+        if len(data) == 0:
+            break
+
+    return data
+
+def _events(syncs, rs, dtype=np.uint32):
+    data = np.zeros((len(syncs),4), dtype=dtype)
+    data[:,0] = syncs
+    data[:,1] = rs.randint(0, 4000, len(syncs))
+    data[:,2] = rs.randint(0, 2, len(syncs))
+    data[:,3] = rs.rand(len(syncs)) < 0.1
+    return data
+
+def _corrupted(rs, head, tail, dtype=np.uint32):
+    """
+    non-decreasing syncs (with repeats) after a head of random syncs,
+    which may be larger or smaller than those of the valid data.
+    """
+    good = np.cumsum(rs.randint(0, 3, tail)) + rs.randint(0, 1000)
+    bad = rs.randint(0, 2*good[-1]+10, head)
+    return _events(np.append(bad, good), rs, dtype)
+
+def _check(data):
+    new = hht3.filter_decreasing_syncs(data)
+    old = _filter_decreasing_syncs_old(data)
+    assert new.dtype == old.dtype
+    assert np.array_equal(new, old)
+
+def test_corrupted_head():
+    rs = np.random.RandomState(0)
+    for dtype in (np.uint32, np.uint64, np.int64):
+        for head in (1, 2, 5, 50):
+            for i in range(20):
+                _check(_corrupted(rs, head, 200, dtype))
+
+def test_no_corruption():
+    rs = np.random.RandomState(1)
+    data = _events(np.cumsum(rs.randint(0, 3, 100)), rs)
+    assert np.array_equal(hht3.filter_decreasing_syncs(data), data)
+    _check(data)
+
+def test_decreasing_after_minimum():
+    # the minimum sync is followed by more corrupted events
+    rs = np.random.RandomState(2)
+    syncs = np.array([50, 3, 40, 41, 7, 8, 8, 9, 12, 30])
+    _check(_events(syncs, rs))
+    assert list(hht3.filter_decreasing_syncs(_events(syncs, rs))[:,0]) == \
+            [7, 8, 8, 9, 12, 30]
+
+def test_all_decreasing():
+    rs = np.random.RandomState(3)
+    _check(_events(np.arange(20)[::-1], rs))
+
+def test_single_event():
+    rs = np.random.RandomState(4)
+    _check(_events([5], rs))
@@ -0,0 +1,112 @@
+"""
+tests for the readout correction errors in lde.ro_c_err against a 50-digit
+evaluation (mpmath), with numerical derivatives of the corrected
+populations.
+"""
+
+import numpy as np
+import pytest
+
+from analysis.lib.lde import ro_c_err
+
+mp = pytest.importorskip('mpmath')
+
+
+def _r_mp(F0a, F0b, F1a, F1b, N00, N01, N10, N11):
+    # corrected populations [00, 01, 10, 11]; U works on [11, 10, 01, 00]
+    U = mp.matrix([[F1a*F1b, F1a*(1-F0b), F1b*(1-F0a), (1-F0a)*(1-F0b)],
+        [F1a*(1-F1b), F1a*F0b, (1-F0a)*(1-F1b), F0b*(1-F0a)],
+        [F1b*(1-F1a), (1-F1a)*(1-F0b), F0a*F1b, F0a*(1-F0b)],
+        [(1-F1a)*(1-F1b), F0b*(1-F1a), F0a*(1-F1b), F0a*F0b]])
+    N_tot = N00 + N01 + N10 + N11
+    r = U**-1 * mp.matrix([N11, N10, N01, N00]) / N_tot
+    return [r[3], r[2], r[1], r[0]]
+
+def _variance_mp(F, dF, N, func):
+    """
+    variance of func(r) from the multinomial counts and the fidelity
+    uncertainties; returns it with the populations r (mpmath numbers).
+    """
+    F = [ mp.mpf(float(x)) for x in F ]
+    dF = [ mp.mpf(float(x)) for x in dF ]
+    N = [ mp.mpf(float(x)) for x in N ]
+    N_tot = sum(N)
+
+    def f(x, k):
+        args = F + N
+        args[k] = x
+        return func(_r_mp(*args))
+
+    v = 0
+    for k in range(4):
+        v += mp.diff(lambda x: f(x, 4+k), N[k])**2 * N[k]*(N_tot-N[k])/N_tot
+        v += (mp.diff(lambda x: f(x, k), F[k]) * dF[k])**2
+    return v, _r_mp(*(F + N))
+
+def _readout_correction_errors_mp(F, dF, N):
+    with mp.workdps(50):
+        return [ float(mp.sqrt(_variance_mp(F, dF, N, lambda r: r[i])[0])) \
+                for i in range(4) ]
+
+def _summed_error_mp(F, dF, N):
+    with mp.workdps(50):
+        v, r = _variance_mp(F, dF, N, lambda r: r[1] + r[2])
+        return float(mp.sqrt(v))
+
+def _sqrt_product_error_mp(F, dF, N):
+    with mp.workdps(50):
+        v, r = _variance_mp(F, dF, N, lambda r: r[0]*r[3])
+        if r[0]*r[3] <= 0:
+            return 0., 0.
+        return float(mp.sqrt(v / (4*r[0]*r[3]))), float(min(r[0], r[3]))
+
+def _cases():
+    # cases where the generated formulas deviated by 8e-12 and 4e-12; in
+    # the first, r11 is 1e-5
+    yield [0.76808366, 0.74236889, 0.99396746, 0.91365006], \
+            [0.00040683, 0.02553478, 0.02145596, 0.02619777], \
+            [88960, 51939, 15919, 11887]
+    yield [0.6953959, 0.68393006, 0.67966384, 0.804773], \
+            [0.01044748, 0.02800399, 0.0007139, 0.00486875], [1, 4, 2, 8]
+
+    rs = np.random.RandomState(0)
+    for i in range(40):
+        F = rs.uniform(0.5, 0.999, 4)
+        dF = rs.uniform(0, 0.05, 4) * (i%3 != 0)
+        N = rs.randint(0, 10**rs.randint(1,7), 4)
+        if i%2 == 0:
+            N[rs.randint(4)] = rs.randint(0, 3)
+        yield list(F), list(dF), list(N)
+
+def test_readout_correction_errors():
+    for F, dF, N in _cases():
+        ref = _readout_correction_errors_mp(F, dF, N)
+        err = ro_c_err.get_readout_correction_errors(*(F + dF + N))
+        assert np.allclose(err, ref, rtol=4e-13, atol=0), (F, dF, N, err, ref)
+
+def test_summed_error():
+    for F, dF, N in _cases():
+        ref = _summed_error_mp(F, dF, N)
+        err = ro_c_err.get_summed_error(*(F + dF + N))
+        assert abs(err - ref) <= 4e-13 * ref, (F, dF, N, err, ref)
+
+def test_sqrt_product_error():
+    for F, dF, N in _cases():
+        ref, rmin = _sqrt_product_error_mp(F, dF, N)
+        err = ro_c_err.get_sqrt_product_error(*(F + dF + N))
+        if ref == 0:
+            assert err == 0
+        else:
+            # 1e-12, up to the cancellation for r00 or r11 < 1e-4
+            tol = 1e-12 * max(1., 1e-4/rmin)
+            assert abs(err - ref) <= tol * ref, (F, dF, N, err, ref)
+
+def test_sqrt_product_error_broadcast():
+    cases = list(_cases())
+    F, dF, N = [ np.array(c).T for c in zip(*cases) ]
+    err = ro_c_err.get_sqrt_product_error(*(list(F) + list(dF) + list(N)))
+    assert err.shape == (len(cases),)
+    for i, (_F, _dF, _N) in enumerate(cases):
+        assert np.allclose(err[i],
+                ro_c_err.get_sqrt_product_error(*(_F + _dF + _N)),
+                rtol=1e-12, atol=0)